@@ -1,11 +1,14 @@
-import pygame
-import math
-import time
-from queue import PriorityQueue
+from camino import greedy
+from camino.visual import CLOSED, EMPTY, END, OBSTACLE, OPEN, PATH, START, run
 
 # Configuraciones generales
 WIDTH = 800
 ROWS = 50
+
+# Animación: redibujar cada REDRAW_EVERY expansiones (None = mostrar sólo el
+# resultado) o, si REDRAW_MS no es None, como mucho cada REDRAW_MS milisegundos
+REDRAW_EVERY = 1
+REDRAW_MS = None
 GRID_COLOR = (200, 200, 200)
 BACKGROUND_COLOR = (255, 255, 255)
 
@@ -17,206 +20,19 @@ OPEN_COLOR = [255,125,0]
 CLOSED_COLOR = [255,175,0]
 PATH_COLOR = [0,0,255]
 
-# Inicializar pygame
-pygame.init()
-win = pygame.display.set_mode((WIDTH, WIDTH))
-pygame.display.set_caption("Camino más corto Algoritmo 2")
-
-# Clase para manejar las celdas de la cuadrícula
-class Cell:
-    def __init__(self, row, col, width):
-        self.row = row
-        self.col = col
-        self.x = row * width
-        self.y = col * width
-        self.width = width
-        self.color = BACKGROUND_COLOR
-        self.neighbors = []
-
-    def get_pos(self):
-        return self.row, self.col
-
-    def is_closed(self):
-        return self.color == CLOSED_COLOR
-
-    def is_open(self):
-        return self.color == OPEN_COLOR
-
-    def is_obstacle(self):
-        return self.color == OBSTACLE_COLOR
-
-    def is_start(self):
-        return self.color == START_COLOR
-
-    def is_end(self):
-        return self.color == END_COLOR
-
-    def reset(self):
-        self.color = BACKGROUND_COLOR
-
-    def make_start(self):
-        self.color = START_COLOR
-
-    def make_closed(self):
-        self.color = CLOSED_COLOR
-
-    def make_open(self):
-        self.color = OPEN_COLOR
-
-    def make_obstacle(self):
-        self.color = OBSTACLE_COLOR
-
-    def make_end(self):
-        self.color = END_COLOR
-
-    def make_path(self):
-        self.color = PATH_COLOR
-
-    def draw(self, win):
-        pygame.draw.rect(win, self.color, (self.x, self.y, self.width, self.width))
-
-    def update_neighbors(self, grid):
-        self.neighbors = []
-        directions = [
-            (0, 1), (1, 0), (0, -1), (-1, 0),  # Horizontal y vertical
-            (-1, -1), (-1, 1), (1, -1), (1, 1) # Diagonales
-        ]
-        for d in directions:
-            row, col = self.row + d[0], self.col + d[1]
-            if 0 <= row < ROWS and 0 <= col < ROWS and not grid[row][col].is_obstacle():
-                self.neighbors.append((grid[row][col], 1 if d[0] == 0 or d[1] == 0 else math.sqrt(2)))
-
-# Funciones para el algoritmo y configuración de la cuadrícula
-def heuristic(cell1, cell2):
-    x1, y1 = cell1.get_pos()
-    x2, y2 = cell2.get_pos()
-    return math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
-
-def reconstruct_path(came_from, current, draw):
-    path_length = 0
-    while current in came_from:
-        current = came_from[current]
-        current.make_path()
-        draw()
-        path_length += 1
-    return path_length
-
-def algorithm(draw, grid, start, end):
-    analyzed_coords = 0
-    open_set = [(start, 0)]
-    came_from = {}
-    closed_set = set()
-    start_time = time.time()
-
-    while open_set:
-        open_set.sort(key=lambda x: x[1])  # Ordenar por costo
-        current, _ = open_set.pop(0)
-
-        if current == end:
-            path_length = reconstruct_path(came_from, end, draw)
-            elapsed_time = time.time() - start_time
-            return elapsed_time, analyzed_coords, path_length
-
-        closed_set.add(current)
-        for neighbor, move_cost in current.neighbors:
-            if neighbor in closed_set:
-                continue
-
-            total_cost = move_cost + heuristic(neighbor, end)
-            if neighbor not in [cell[0] for cell in open_set]:
-                came_from[neighbor] = current
-                analyzed_coords += 1
-                open_set.append((neighbor, total_cost))
-                neighbor.make_open()
-
-        draw()
-
-        if current != start:
-            current.make_closed()
-
-    return None, analyzed_coords, 0
-
-def make_grid(rows, width):
-    grid = []
-    gap = width // rows
-    for i in range(rows):
-        grid.append([])
-        for j in range(rows):
-            cell = Cell(i, j, gap)
-            grid[i].append(cell)
-    return grid
-
-def draw_grid(win, rows, width):
-    gap = width // rows
-    for i in range(rows):
-        pygame.draw.line(win, GRID_COLOR, (0, i * gap), (width, i * gap))
-        pygame.draw.line(win, GRID_COLOR, (i * gap, 0), (i * gap, width))
-
-def draw(win, grid, rows, width):
-    win.fill(BACKGROUND_COLOR)
-    for row in grid:
-        for cell in row:
-            cell.draw(win)
-    draw_grid(win, rows, width)
-    pygame.display.update()
-
-def get_clicked_pos(pos, rows, width):
-    gap = width // rows
-    y, x = pos
-    return y // gap, x // gap
-
-def main(win, width):
-    clock=pygame.time.Clock()
-    grid = make_grid(ROWS, width)
-    start, end = None, None
-
-    run = True
-    while run:
-        draw(win, grid, ROWS, width)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                run = False
-
-            if pygame.mouse.get_pressed()[0]:  # Izquierdo
-                pos = pygame.mouse.get_pos()
-                row, col = get_clicked_pos(pos, ROWS, width)
-                cell = grid[row][col]
-                if not start and cell != end:
-                    start = cell
-                    start.make_start()
-                elif not end and cell != start:
-                    end = cell
-                    end.make_end()
-                elif cell != end and cell != start:
-                    cell.make_obstacle()
-
-            elif pygame.mouse.get_pressed()[2]:  # Derecho
-                pos = pygame.mouse.get_pos()
-                row, col = get_clicked_pos(pos, ROWS, width)
-                cell = grid[row][col]
-                cell.reset()
-                if cell == start:
-                    start = None
-                elif cell == end:
-                    end = None
-
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE and start and end:
-                    for row in grid:
-                        for cell in row:
-                            cell.update_neighbors(grid)
-
-                    elapsed_time, analyzed_coords, path_length = algorithm(lambda: draw(win, grid, ROWS, width), grid, start, end)
-                    if elapsed_time is not None:
-                        print("-"*100)
-                        print(f"Tiempo de búsqueda: {elapsed_time:.4f} segundos")
-                        print(f"Coordenadas analizadas: {analyzed_coords}")
-                        print(f"Longitud del camino: {path_length} coordenadas")
-
-                if event.key == pygame.K_c:
-                    start, end = None, None
-                    grid = make_grid(ROWS, width)
-        clock.tick(120)  # Limitar la velocidad de cuadros por segundo
-    pygame.quit()
-
-main(win, WIDTH)
+PALETTE = {
+    EMPTY: BACKGROUND_COLOR, START: START_COLOR, END: END_COLOR, OBSTACLE: OBSTACLE_COLOR,
+    OPEN: OPEN_COLOR, CLOSED: CLOSED_COLOR, PATH: PATH_COLOR,
+}
+
+def report(result):
+    if result.found:
+        print("-"*100)
+        print(f"Tiempo de búsqueda: {result.elapsed:.4f} segundos")
+        print(f"Coordenadas analizadas: {result.analyzed}")
+        print(f"Longitud del camino: {result.path_length} coordenadas")
+
+if __name__ == "__main__":
+    # Limitar la velocidad de cuadros por segundo a 120
+    run(greedy, "Camino más corto Algoritmo 2", PALETTE, GRID_COLOR, report, WIDTH, ROWS, fps=120,
+        redraw_every=REDRAW_EVERY, redraw_ms=REDRAW_MS)
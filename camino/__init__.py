@@ -0,0 +1,19 @@
+# Núcleo de búsqueda de caminos en cuadrículas, sin dependencia de pygame.
+# La interfaz gráfica opcional está en camino.visual.
+from .grid import DIRECTIONS, DIRECTIONS_ALT, Grid
+from .components import Components
+from .search import SearchListener, SearchResult, SearchStats, TimedListener, heuristic, reconstruct_path
+from .astar import astar
+from .anytime import ara_star, ara_star_iter
+from .greedy import greedy
+from .dijkstra import dijkstra
+from .jps import jps
+from .bidirectional import bidirectional_astar, bidirectional_dijkstra
+from .field import DistanceField, FieldCache, distance_field, wavefront
+from .batch import solve_batch, solve_batch_parallel
+from .cache import PathCache
+from .mapfile import load_benchmark_map, load_image_map, load_map, load_text_map, open_map, save_map
+from .dstar import DStarLite
+from .hpa import HPAStar
+from .landmarks import Landmarks
+from .profiling import profile_search
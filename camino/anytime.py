@@ -0,0 +1,141 @@
+import time
+from heapq import heapify, heappop, heappush
+
+from .grid import DIRECTIONS, SQRT2
+from .search import SearchResult, admissible, heuristic_function, reconstruct_path, search_stats, timed
+
+
+# ARA* (A* anytime): una serie de búsquedas A* ponderadas con pesos cada vez
+# menores que reutilizan el trabajo anterior. La primera, con weight, encuentra
+# un camino enseguida; cada una de las siguientes baja el peso en step y sólo
+# vuelve a expandir los nodos cuyo costo mejoró. Cada camino se entrega como un
+# SearchResult cuyo bound es la cota demostrada de suboptimalidad:
+#   min(peso, costo / min(g + h) entre los nodos pendientes)
+# y la serie termina al llegar a bound 1 (camino óptimo).
+#
+# Con budget (segundos), al agotarse el tiempo se corta la búsqueda en curso
+# y se queda el último camino entregado; el primero se busca siempre hasta el
+# final. metric y diagonal son los de astar; si la heurística no es admisible
+# con esas direcciones y ese costo diagonal, bound queda en None.
+def ara_star_iter(grid, start, end, listener=None, directions=DIRECTIONS, weight=3, step=0.5,
+                  budget=None, metric="octile", diagonal=SQRT2):
+    table = grid.neighbor_table(directions, diagonal)
+    mask = grid.mask.data
+    cols = grid.cols
+    listener = timed(listener)
+    inf = float("inf")
+
+    start_time = time.time()
+    deadline = inf if budget is None else start_time + budget
+    if grid.unreachable(start, end):
+        elapsed_time = time.time() - start_time
+        yield SearchResult(None, inf, elapsed=elapsed_time, stats=search_stats(elapsed_time, listener, 0, 0))
+        return
+    h = heuristic_function(grid, end, metric, diagonal)
+    proven = admissible(metric, directions, diagonal)
+
+    count = 0
+    analyzed = 0
+    expanded = 0
+    stale = 0
+    g_score = {start: 0}
+    came_from = {}
+    open_set = [(weight * h(start), count, start)]
+    open_set_hash = {start: count}
+    closed = set()
+    # Nodos cerrados que mejoraron: se reabren al empezar la siguiente búsqueda
+    incons = set()
+    epsilon = weight
+    delivered = False
+
+    while True:
+        finished = True
+        while open_set:
+            key, entry, current = open_set[0]
+            if open_set_hash.get(current) != entry:
+                heappop(open_set)
+                stale += 1
+                continue  # Entrada obsoleta
+            if g_score.get(end, inf) <= key:
+                break
+            if delivered and time.time() > deadline:
+                finished = False
+                break
+            heappop(open_set)
+            del open_set_hash[current]
+            closed.add(current)
+
+            expanded += 1
+            for offset, move_cost in table[mask[current]]:
+                neighbor = current + offset
+                tentative_g_score = g_score[current] + move_cost
+
+                if tentative_g_score < g_score.get(neighbor, inf):
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g_score
+                    if neighbor in closed:
+                        incons.add(neighbor)
+                        continue
+                    count += 1
+                    heappush(open_set, (tentative_g_score + epsilon * h(neighbor), count, neighbor))
+                    if neighbor not in open_set_hash:
+                        analyzed += 1
+                        if listener is not None:
+                            listener.opened(neighbor)
+                    open_set_hash[neighbor] = count
+
+            if listener is not None:
+                listener.closed(current)
+                listener.step()
+
+        if not finished:
+            return  # Sin tiempo: vale el último camino entregado
+        elapsed_time = time.time() - start_time
+        stats = search_stats(elapsed_time, listener, expanded, count + 1, stale, count)
+        if end not in g_score:
+            yield SearchResult(None, inf, analyzed, elapsed_time, expanded, stats)
+            return
+
+        # Los nodos que mejoraron después de alcanzar end ya apuntan a su nuevo
+        # predecesor, así que el camino puede costar menos que g_score[end]:
+        # el costo se suma sobre el camino entregado
+        path = reconstruct_path(came_from, end)
+        cost = 0
+        for a, b in zip(path, path[1:]):
+            (ar, ac), (br, bc) = divmod(a, cols), divmod(b, cols)
+            cost += diagonal if ar != br and ac != bc else 1
+        pending = [g_score[node] + h(node) for node in (*open_set_hash, *incons)]
+        lower = min(pending, default=cost)
+        bound = min(epsilon, cost / lower) if lower > 0 else 1
+        yield SearchResult(path, cost, analyzed, elapsed_time, expanded, stats, max(bound, 1) if proven else None)
+        delivered = True
+        if bound <= 1 or time.time() > deadline:
+            return
+
+        # Siguiente búsqueda: menos peso, abiertos e inconsistentes con la
+        # clave nueva y la lista de cerrados vacía
+        epsilon = max(epsilon - step, 1)
+        nodes = set(open_set_hash) | incons
+        open_set = []
+        open_set_hash = {}
+        for node in nodes:
+            count += 1
+            open_set.append((g_score[node] + epsilon * h(node), count, node))
+            open_set_hash[node] = count
+        heapify(open_set)
+        closed = set()
+        incons = set()
+
+
+# Versión de una sola llamada, con la firma de los demás algoritmos: devuelve
+# el mejor camino encontrado dentro de budget segundos (o el óptimo si no hay
+# límite) y lo dibuja en el receptor.
+def ara_star(grid, start, end, listener=None, directions=DIRECTIONS, weight=3, step=0.5, budget=None,
+             metric="octile", diagonal=SQRT2):
+    result = None
+    for result in ara_star_iter(grid, start, end, listener, directions, weight, step, budget, metric, diagonal):
+        pass
+    if listener is not None and result.found:
+        for node in reversed(result.path[:-1]):
+            listener.path(node)
+    return result
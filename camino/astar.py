@@ -0,0 +1,101 @@
+import time
+from heapq import heappop, heappush
+
+from .grid import DIRECTIONS, SQRT2
+from .search import SearchResult, admissible, heuristic, heuristic_function, reconstruct_path, search_stats, timed
+
+
+# Algoritmo A* (script 2): costo 1 en horizontal/vertical y √2 en diagonal.
+# start y end son índices planos de la cuadrícula. La lista abierta es un heap
+# de (f, orden, nodo) y open_set_hash guarda el orden de la entrada vigente de
+# cada nodo abierto; al mejorar un nodo se inserta una entrada nueva y la
+# anterior se descarta cuando sale del heap.
+#
+# Sin metric la heurística es la euclídea de siempre, calculada en cada
+# inserción. Con metric ("euclidean", "octile", "chebyshev", "manhattan") se
+# calcula igual, con la función de heuristic_function. diagonal es el costo de
+# los movimientos diagonales: con √2 conviene "octile"; con 1, como en el
+# script 4, "chebyshev" (la euclídea ya no es admisible); con sólo 4
+# direcciones, "manhattan". metric también puede ser un objeto con su propio
+# método function(goal), como Landmarks (heurística ALT). Para muchas consultas
+# hacia el mismo end se puede pasar en estimates la tabla de heuristic_table
+# (con el mismo metric), que se lee en lugar de calcular.
+#
+# weight > 1 da A* ponderado (f = g + weight·h): expande muchos menos nodos y,
+# con una heurística admisible, el costo no pasa de weight veces el óptimo
+# (SearchResult.bound, que queda en None si la heurística no es admisible con
+# esas direcciones y ese costo diagonal). Con weight < 1 la heurística sigue
+# siendo admisible y el camino es óptimo: la cota es 1. Para mejorar el camino
+# con un límite de tiempo está ara_star.
+def astar(grid, start, end, listener=None, directions=DIRECTIONS, metric=None, diagonal=SQRT2, weight=1,
+          estimates=None):
+    table = grid.neighbor_table(directions, diagonal)
+    mask = grid.mask.data
+    listener = timed(listener)
+    cols = grid.cols
+    end_pos = grid.pos(end)
+
+    count = 0
+    analyzed = 0
+    expanded = 0
+    stale = 0
+    open_set = [(0, count, start)]
+    came_from = {}
+    # El estado sólo se guarda para los nodos alcanzados; el resto vale infinito
+    g_score = {start: 0}
+    inf = float("inf")
+
+    open_set_hash = {start: count}
+    start_time = time.time()
+    if grid.unreachable(start, end):
+        elapsed_time = time.time() - start_time
+        return SearchResult(None, inf, elapsed=elapsed_time, stats=search_stats(elapsed_time, listener, 0, 0))
+    if estimates is not None:
+        h = estimates.item
+    elif metric is not None:
+        h = heuristic_function(grid, end, metric, diagonal)
+    else:
+        h = None
+
+    while open_set:
+        _, entry, current = heappop(open_set)
+        if open_set_hash.get(current) != entry:
+            stale += 1
+            continue  # Entrada obsoleta
+        del open_set_hash[current]
+
+        if current == end:
+            path = reconstruct_path(came_from, end, listener)
+            elapsed_time = time.time() - start_time
+            # Cada inserción salvo la de start evalúa la heurística una vez
+            stats = search_stats(elapsed_time, listener, expanded, count + 1, stale, count)
+            bound = max(weight, 1) if admissible(metric, directions, diagonal) else None
+            return SearchResult(path, g_score[end], analyzed, elapsed_time, expanded, stats, bound)
+
+        expanded += 1
+        for offset, move_cost in table[mask[current]]:
+            neighbor = current + offset
+            tentative_g_score = g_score[current] + move_cost
+
+            if tentative_g_score < g_score.get(neighbor, inf):
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                if h is None:
+                    f_score = tentative_g_score + weight * heuristic(divmod(neighbor, cols), end_pos)
+                else:
+                    f_score = tentative_g_score + weight * h(neighbor)
+                count += 1
+                heappush(open_set, (f_score, count, neighbor))
+                if neighbor not in open_set_hash:
+                    analyzed += 1
+                    if listener is not None:
+                        listener.opened(neighbor)
+                open_set_hash[neighbor] = count
+
+        if listener is not None:
+            listener.closed(current)
+            listener.step()
+
+    elapsed_time = time.time() - start_time
+    stats = search_stats(elapsed_time, listener, expanded, count + 1, stale, count)
+    return SearchResult(None, inf, analyzed, elapsed_time, expanded, stats)
@@ -0,0 +1,75 @@
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .astar import astar
+from .grid import DIRECTIONS, Grid
+from .search import SearchResult
+
+
+# Resuelve muchas consultas (inicio, fin) sobre un mismo mapa. La máscara de
+# vecinos y las tablas de desplazamientos pertenecen a la cuadrícula, así que
+# se calculan una sola vez y todas las consultas las comparten. Las consultas
+# cuyo inicio o fin es un obstáculo se descartan sin buscar, y el índice de
+# regiones se prepara antes de empezar para que las de inicio y fin en
+# regiones distintas se respondan sin buscar.
+def solve_batch(grid, pairs, solver=astar, directions=DIRECTIONS):
+    cells = grid.cells
+    # Con el índice de regiones construido, astar y los demás responden sin
+    # buscar las consultas entre regiones distintas (grid.unreachable)
+    grid.build_components()
+    results = []
+    for start, end in pairs:
+        if cells[start] or cells[end]:
+            results.append(SearchResult(None, float("inf")))
+            continue
+        results.append(solver(grid, start, end, None, directions))
+    return results
+
+
+# Estado de cada proceso trabajador: la cuadrícula se adjunta a la memoria
+# compartida una sola vez, al arrancar el proceso
+_worker = {}
+
+
+def _layout(size):
+    # Desplazamientos de obstáculos, máscara y etiquetas (int32 alineado) en el
+    # bloque compartido, y su tamaño total
+    labels = -(-2 * size // 8) * 8
+    return 0, size, labels, labels + 4 * size
+
+
+def _attach(name, rows, cols, solver, directions):
+    shm = shared_memory.SharedMemory(name=name)
+    size = rows * cols
+    cells_at, mask_at, labels_at, _ = _layout(size)
+    cells = np.ndarray(size, dtype=np.uint8, buffer=shm.buf, offset=cells_at)
+    mask = np.ndarray(size, dtype=np.uint8, buffer=shm.buf, offset=mask_at)
+    labels = np.ndarray(size, dtype=np.int32, buffer=shm.buf, offset=labels_at)
+    _worker.update(shm=shm, grid=Grid(rows, cols, cells, mask, labels), solver=solver, directions=directions)
+
+
+def _solve_chunk(pairs):
+    return solve_batch(_worker["grid"], pairs, _worker["solver"], _worker["directions"])
+
+
+# Igual que solve_batch pero repartiendo las consultas entre varios procesos.
+# Los obstáculos, la máscara de vecinos y las etiquetas de regiones (calculadas
+# una vez aquí) se copian a un bloque de memoria compartida al que se adjuntan
+# todos los trabajadores, de modo que el mapa no se serializa con cada tarea ni
+# cada trabajador vuelve a etiquetarlo; sólo viajan los pares y los resultados.
+def solve_batch_parallel(grid, pairs, solver=astar, directions=DIRECTIONS, processes=None, chunksize=64):
+    pairs = list(pairs)
+    cells_at, mask_at, labels_at, total = _layout(grid.size)
+    shm = shared_memory.SharedMemory(create=True, size=total)
+    try:
+        np.ndarray(grid.size, dtype=np.uint8, buffer=shm.buf, offset=cells_at)[:] = grid.cells
+        np.ndarray(grid.size, dtype=np.uint8, buffer=shm.buf, offset=mask_at)[:] = grid.mask
+        np.ndarray(grid.size, dtype=np.int32, buffer=shm.buf, offset=labels_at)[:] = grid.components.resolved()
+        chunks = [pairs[i:i + chunksize] for i in range(0, len(pairs), chunksize)]
+        with multiprocessing.Pool(processes, _attach, (shm.name, grid.rows, grid.cols, solver, directions)) as pool:
+            return [result for chunk in pool.map(_solve_chunk, chunks) for result in chunk]
+    finally:
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,242 @@
+import argparse
+import cProfile
+import json
+import platform
+import time
+import tracemalloc
+from functools import partial
+
+import numpy as np
+
+from .anytime import ara_star
+from .astar import astar
+from .dijkstra import dijkstra
+from .field import distance_field
+from .greedy import greedy
+from .grid import DIRECTIONS, DIRECTIONS_ALT, SQRT2, Grid
+from .landmarks import Landmarks
+
+# Comparativa reproducible de las variantes de los cuatro scripts sobre mapas
+# generados con semilla. Uso:
+#   python -m camino.bench --sizes 50 100 200 --output bench.json
+# El tiempo se mide con perf_counter en una pasada y la memoria máxima con
+# tracemalloc en otra (tracemalloc frena la búsqueda). Los contadores salen de
+# SearchResult.stats, así que se cuentan igual en los cuatro, y gap es cuánto
+# más caro es el camino que el óptimo con los mismos costos. Con --profile se
+# guarda además un perfil de cProfile de toda la ejecución.
+
+# (nombre, algoritmo, direcciones, costo diagonal)
+VARIANTS = (
+    ("astar", astar, DIRECTIONS, SQRT2),  # Script 2
+    ("greedy", greedy, DIRECTIONS, SQRT2),  # Script 3
+    ("dijkstra", dijkstra, DIRECTIONS_ALT, 1),  # Script 4
+    ("greedy_alt", greedy, DIRECTIONS_ALT, SQRT2),  # Script 5
+)
+
+# Variantes opcionales (--solvers) para comparar heurísticas y el equilibrio
+# entre calidad y rapidez de A* ponderado y ARA* (con 5 ms por consulta)
+EXTRA_VARIANTS = (
+    ("astar_octile", partial(astar, metric="octile"), DIRECTIONS, SQRT2),
+    ("astar_unit", partial(astar, metric="chebyshev", diagonal=1), DIRECTIONS_ALT, 1),
+    ("astar_w2", partial(astar, metric="octile", weight=2), DIRECTIONS, SQRT2),
+    ("ara_5ms", partial(ara_star, budget=0.005), DIRECTIONS, SQRT2),
+)
+
+
+# Obstáculos sueltos con probabilidad density
+def random_map(size, rng, density=0.3):
+    return Grid(size, cells=(rng.random(size * size) < density).astype(np.uint8))
+
+
+# Laberinto por retroceso recursivo: pasillos en las celdas de fila y columna
+# impares, paredes en el resto
+def maze_map(size, rng):
+    cells = np.ones((size, size), dtype=np.uint8)
+    rows = (size - 1) // 2
+    if rows:
+        visited = np.zeros((rows, rows), dtype=bool)
+        visited[0, 0] = True
+        cells[1, 1] = 0
+        stack = [(0, 0)]
+        while stack:
+            r, c = stack[-1]
+            options = [(r + dr, c + dc) for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0))
+                       if 0 <= r + dr < rows and 0 <= c + dc < rows and not visited[r + dr, c + dc]]
+            if not options:
+                stack.pop()
+                continue
+            nr, nc = options[rng.integers(len(options))]
+            visited[nr, nc] = True
+            cells[2 * nr + 1, 2 * nc + 1] = 0
+            cells[r + nr + 1, c + nc + 1] = 0  # Pared entre las dos celdas
+            stack.append((nr, nc))
+    return Grid(size, cells=cells.reshape(size * size))
+
+
+# Habitaciones separadas por paredes con una puerta en cada tramo de pared
+def room_map(size, rng, room=None):
+    room = room or max(size // 5, 4)
+    cells = np.zeros((size, size), dtype=np.uint8)
+    walls = range(room, size, room)
+    for w in walls:
+        cells[w, :] = 1
+        cells[:, w] = 1
+    bounds = [0, *walls, size]
+    for w in walls:
+        for a, b in zip(bounds, bounds[1:]):
+            low = a + 1 if a else 0  # Sin abrir el cruce de dos paredes
+            if low < b:
+                cells[w, rng.integers(low, b)] = 0
+                cells[rng.integers(low, b), w] = 0
+    return Grid(size, cells=cells.reshape(size * size))
+
+
+# Campo abierto con unos pocos bloques rectangulares
+def open_area_map(size, rng):
+    cells = np.zeros((size, size), dtype=np.uint8)
+    for _ in range(max(size // 10, 1)):
+        h, w = rng.integers(1, max(size // 8, 2), size=2)
+        r, c = rng.integers(0, size, size=2)
+        cells[r:r + h, c:c + w] = 1
+    return Grid(size, cells=cells.reshape(size * size))
+
+
+MAPS = {"random": random_map, "maze": maze_map, "rooms": room_map, "open": open_area_map}
+
+
+# Pares (start, end) distintos, libres y conectados entre sí
+def query_pairs(grid, count, rng, attempts=100):
+    free = np.flatnonzero(grid.cells == 0)
+    pairs = []
+    if free.size < 2:
+        return pairs
+    for _ in range(count * attempts):
+        if len(pairs) == count:
+            break
+        start, end = (int(node) for node in rng.choice(free, 2, replace=False))
+        if grid.components.region(start) == grid.components.region(end):
+            pairs.append((start, end))
+    return pairs
+
+
+# Descarta las tablas de heurística guardadas por el algoritmo (las de
+# Landmarks pasado como metric con partial)
+def forget_tables(solver):
+    for value in getattr(solver, "keywords", {}).values():
+        if isinstance(value, Landmarks):
+            value.clear()
+
+
+def measure(grid, pairs, optimal, solver, directions):
+    elapsed = 0
+    expanded = pushed = stale = heuristic = found = 0
+    gaps = []
+    bounds = []
+    for (start, end), best in zip(pairs, optimal):
+        t = time.perf_counter()
+        result = solver(grid, start, end, None, directions)
+        elapsed += time.perf_counter() - t
+        expanded += result.stats.expanded
+        pushed += result.stats.pushed
+        stale += result.stats.stale
+        heuristic += result.stats.heuristic
+        if result.found:
+            found += 1
+            # max quita el ruido de redondeo entre dos sumas del mismo costo
+            gaps.append(max(result.cost / best - 1, 0.0) if best else 0.0)
+            if result.bound is not None:
+                bounds.append(result.bound)
+
+    tracemalloc.start()
+    peak = 0
+    for start, end in pairs:
+        # Sin la tabla que haya quedado guardada de la pasada anterior, para
+        # que la memoria de cada consulta incluya la de su heurística
+        forget_tables(solver)
+        tracemalloc.reset_peak()
+        solver(grid, start, end, None, directions)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+
+    return {
+        "queries": len(pairs),
+        "found": found,
+        "time": elapsed,
+        "time_per_query": elapsed / len(pairs) if pairs else 0.0,
+        "expanded": expanded,
+        "pushed": pushed,
+        "stale": stale,
+        "heuristic": heuristic,
+        "peak_bytes": peak,
+        "gap_mean": sum(gaps) / len(gaps) if gaps else 0.0,
+        "gap_max": max(gaps, default=0.0),
+        # Peor cota de suboptimalidad declarada por el algoritmo (None si no da)
+        "bound_max": max(bounds, default=None),
+    }
+
+
+def benchmark(kinds=tuple(MAPS), sizes=(50, 100, 200), seeds=(0, 1, 2), queries=10, variants=VARIANTS):
+    records = []
+    for kind in kinds:
+        for size in sizes:
+            for seed in seeds:
+                rng = np.random.default_rng(seed)
+                grid = MAPS[kind](size, rng)
+                pairs = query_pairs(grid, queries, rng)
+                # Costo óptimo de cada par con cada modelo de costos
+                optimal = {}
+                for diagonal in {variant[3] for variant in variants}:
+                    optimal[diagonal] = [float(distance_field(grid, end, DIRECTIONS, diagonal)[0][start])
+                                         for start, end in pairs]
+                for name, solver, directions, diagonal in variants:
+                    record = {"map": kind, "size": size, "seed": seed, "solver": name}
+                    record.update(measure(grid, pairs, optimal[diagonal], solver, directions))
+                    records.append(record)
+    return records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Comparativa de los algoritmos de búsqueda de caminos")
+    parser.add_argument("--maps", nargs="+", default=list(MAPS), choices=list(MAPS), help="tipos de mapa")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[50, 100, 200], help="lados de los mapas")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0, 1, 2], help="semillas de los mapas")
+    parser.add_argument("--queries", type=int, default=10, help="consultas por mapa")
+    parser.add_argument("--solvers", nargs="+", default=[v[0] for v in VARIANTS],
+                        choices=[v[0] for v in VARIANTS + EXTRA_VARIANTS], help="variantes a medir")
+    parser.add_argument("--output", default="bench.json", help="archivo JSON de resultados")
+    parser.add_argument("--profile", help="guardar un perfil de cProfile en este archivo")
+    args = parser.parse_args(argv)
+
+    variants = [variant for variant in VARIANTS + EXTRA_VARIANTS if variant[0] in args.solvers]
+    if args.profile:
+        profiler = cProfile.Profile()
+        records = profiler.runcall(benchmark, args.maps, args.sizes, args.seeds, args.queries, variants)
+        profiler.dump_stats(args.profile)
+    else:
+        records = benchmark(args.maps, args.sizes, args.seeds, args.queries, variants)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "maps": args.maps,
+            "sizes": args.sizes,
+            "seeds": args.seeds,
+            "queries": args.queries,
+        },
+        "results": records,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1)
+
+    print(f"{'mapa':8} {'lado':>5} {'semilla':>7} {'algoritmo':13} {'ms/consulta':>12} {'expandidos':>11} "
+          f"{'insertados':>11} {'memoria KiB':>12} {'gap medio':>10}")
+    for record in records:
+        print(f"{record['map']:8} {record['size']:5} {record['seed']:7} {record['solver']:13} "
+              f"{record['time_per_query'] * 1000:12.3f} {record['expanded']:11} {record['pushed']:11} "
+              f"{record['peak_bytes'] / 1024:12.1f} {record['gap_mean']:10.4f}")
+    print(f"Resultados guardados en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
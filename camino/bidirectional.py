@@ -0,0 +1,106 @@
+import time
+from heapq import heappop, heappush
+
+from .grid import DIRECTIONS
+from .search import SearchResult, heuristic, reconstruct_path
+
+
+# Búsqueda desde start y desde end a la vez. En cada paso se expande el lado
+# cuya lista abierta tiene la clave mínima menor; cada relajación que alcanza un
+# nodo ya etiquetado por el otro lado propone un camino completo (best). La
+# búsqueda termina cuando la suma de las claves mínimas de ambos lados llega a
+# best, y entonces best es óptimo.
+#
+# potential(v) es el potencial del lado de start; el de end es -potential(v).
+# Con potencial nulo es Dijkstra bidireccional y con el promedio
+# (h(v, end) - h(v, start)) / 2 es A* bidireccional: así ambos lados trabajan
+# sobre los mismos costos reducidos, que son no negativos si h es consistente.
+def _bidirectional(grid, start, end, listener, table, potential=None):
+    mask = grid.mask.data
+    inf = float("inf")
+    start_time = time.time()
+    if grid.unreachable(start, end):
+        return SearchResult(None, inf, elapsed=time.time() - start_time)
+
+    # Índice 0: lado de start; índice 1: lado de end
+    g_score = ({start: 0}, {end: 0})
+    came_from = ({}, {})
+    sign = (1, -1)
+    if potential is None:
+        heaps = ([(0, 0, start)], [(0, 1, end)])
+    else:
+        heaps = ([(potential(start), 0, start)], [(-potential(end), 1, end)])
+    open_set_hash = ({start: 0}, {end: 1})
+    count = 1
+    analyzed = 0
+    expanded = 0
+    best = 0 if start == end else inf
+    meeting = start if start == end else None
+
+    while True:
+        for side in (0, 1):
+            heap, live = heaps[side], open_set_hash[side]
+            while heap and live.get(heap[0][2]) != heap[0][1]:
+                heappop(heap)  # Entrada obsoleta
+        if not heaps[0] or not heaps[1] or heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        current = heappop(heaps[side])[2]
+        del open_set_hash[side][current]
+        expanded += 1
+
+        g_side, g_other = g_score[side], g_score[1 - side]
+        came, live, heap = came_from[side], open_set_hash[side], heaps[side]
+        for offset, move_cost in table[mask[current]]:
+            neighbor = current + offset
+            tentative_g_score = g_side[current] + move_cost
+
+            if tentative_g_score < g_side.get(neighbor, inf):
+                came[neighbor] = current
+                g_side[neighbor] = tentative_g_score
+                key = tentative_g_score
+                if potential is not None:
+                    key += sign[side] * potential(neighbor)
+                count += 1
+                heappush(heap, (key, count, neighbor))
+                if neighbor not in live:
+                    analyzed += 1
+                    if listener is not None:
+                        listener.opened(neighbor)
+                live[neighbor] = count
+
+                if neighbor in g_other and tentative_g_score + g_other[neighbor] < best:
+                    best = tentative_g_score + g_other[neighbor]
+                    meeting = neighbor
+
+        if listener is not None:
+            listener.closed(current)
+            listener.step()
+
+    if meeting is None:
+        return SearchResult(None, inf, analyzed, time.time() - start_time, expanded)
+
+    # Camino start..meeting seguido de meeting..end (sin repetir meeting)
+    path = reconstruct_path(came_from[0], meeting) + reconstruct_path(came_from[1], meeting)[::-1][1:]
+    if listener is not None:
+        for node in reversed(path[:-1]):
+            listener.path(node)
+    return SearchResult(path, best, analyzed, time.time() - start_time, expanded)
+
+
+# A* bidireccional con los costos de astar (1 y √2)
+def bidirectional_astar(grid, start, end, listener=None, directions=DIRECTIONS):
+    cols = grid.cols
+    start_pos, end_pos = grid.pos(start), grid.pos(end)
+
+    def potential(node):
+        pos = divmod(node, cols)
+        return (heuristic(pos, end_pos) - heuristic(pos, start_pos)) / 2
+
+    return _bidirectional(grid, start, end, listener, grid.neighbor_table(directions), potential)
+
+
+# Dijkstra bidireccional con los costos de dijkstra (todos los movimientos valen 1)
+def bidirectional_dijkstra(grid, start, end, listener=None, directions=DIRECTIONS):
+    return _bidirectional(grid, start, end, listener, grid.neighbor_table(directions, 1))
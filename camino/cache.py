@@ -0,0 +1,113 @@
+import time
+
+from .astar import astar
+from .grid import DIRECTIONS, SQRT2
+from .search import SearchResult
+
+
+# Caché de caminos por (start, end) para consultas repetidas sobre un mapa que
+# no cambia. Las entradas valen mientras grid.version sea la misma; en cuanto
+# una celda pasa a ser o deja de ser obstáculo se descartan todas. Guarda como
+# mucho maxsize caminos y descarta primero el menos usado.
+#
+# Con subpaths, una consulta cuyos extremos están los dos en un camino guardado
+# se responde con el tramo entre ellos (en cualquier sentido, porque los
+# movimientos son simétricos): un tramo de un camino óptimo también es óptimo.
+# Sólo es correcto con algoritmos óptimos (astar, dijkstra, jps, ...), no con
+# greedy ni HPAStar. diagonal es el costo diagonal del algoritmo, para calcular
+# el costo del tramo.
+#
+# Se usa como cualquier algoritmo: cache(grid, start, end, listener, directions).
+class PathCache:
+    def __init__(self, solver=astar, maxsize=1024, subpaths=True, diagonal=SQRT2):
+        self.solver = solver
+        self.maxsize = maxsize
+        self.subpaths = subpaths
+        self.diagonal = diagonal
+        self.grid = None
+        self.hits = 0
+        self.subpath_hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.subpath_hits + self.misses
+        return (self.hits + self.subpath_hits) / total if total else 0.0
+
+    def clear(self):
+        self.entries = {}  # (start, end) -> (camino, costo, costos acumulados)
+        self.through = {}  # nodo -> {(start, end): posición en el camino}
+
+    def __call__(self, grid, start, end, listener=None, directions=DIRECTIONS):
+        if grid is not self.grid or directions != self.directions or grid.version != self.version:
+            self.grid = grid
+            self.directions = directions
+            self.version = grid.version
+            self.clear()
+
+        start_time = time.time()
+        key = (start, end)
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.entries[key] = entry
+            self.hits += 1
+            path = None if entry[0] is None else list(entry[0])
+            return self._hit(path, entry[1], start_time, listener)
+
+        if self.subpaths:
+            found = self._subpath(start, end)
+            if found is not None:
+                self.subpath_hits += 1
+                return self._hit(found[0], found[1], start_time, listener)
+
+        self.misses += 1
+        result = self.solver(grid, start, end, listener, directions)
+        self._store(key, result)
+        return result
+
+    def _hit(self, path, cost, start_time, listener):
+        if listener is not None and path is not None:
+            for node in reversed(path[:-1]):
+                listener.path(node)
+        return SearchResult(path, cost, elapsed=time.time() - start_time)
+
+    def _subpath(self, start, end):
+        # Tramo start..end de algún camino guardado que pase por ambos
+        with_start = self.through.get(start)
+        with_end = self.through.get(end)
+        if not with_start or not with_end:
+            return None
+        for key, i in with_start.items():
+            j = with_end.get(key)
+            if j is None:
+                continue
+            entry = self.entries.pop(key)
+            self.entries[key] = entry
+            path, _, costs = entry
+            if i <= j:
+                return path[i:j + 1], costs[j] - costs[i]
+            return path[j:i + 1][::-1], costs[i] - costs[j]
+        return None
+
+    def _store(self, key, result):
+        path = None if result.path is None else list(result.path)
+        costs = None
+        if path is not None and self.subpaths:
+            cols = self.grid.cols
+            costs = [0]
+            for a, b in zip(path, path[1:]):
+                (ar, ac), (br, bc) = divmod(a, cols), divmod(b, cols)
+                costs.append(costs[-1] + (self.diagonal if ar != br and ac != bc else 1))
+            for i, node in enumerate(path):
+                self.through.setdefault(node, {})[key] = i
+        self.entries[key] = (path, result.cost, costs)
+
+        while len(self.entries) > self.maxsize:
+            old = next(iter(self.entries))
+            path, _, costs = self.entries.pop(old)
+            if costs is not None:
+                for node in path:
+                    nodes = self.through[node]
+                    del nodes[old]
+                    if not nodes:
+                        del self.through[node]
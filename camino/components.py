@@ -0,0 +1,227 @@
+from collections import deque
+
+import numpy as np
+
+# Desplazamientos (fila, columna) hacia las 8 celdas vecinas
+AROUND = tuple((dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc)
+
+
+# Regiones conexas de celdas libres con los movimientos de los algoritmos (8
+# direcciones, también en diagonal entre dos obstáculos). Cada celda libre lleva
+# una etiqueta y las etiquetas que quedan unidas al abrir un paso se agrupan con
+# union-find, así que saber si dos celdas están en la misma región es O(1).
+#
+# Se calcula una vez por mapa (grid.components) y los algoritmos sólo lo
+# consultan si ya existe (grid.unreachable). Se pone al día con
+# grid.changes_since: liberar una celda une las regiones de sus vecinas;
+# bloquearla sólo obliga a buscar si la región se partió cuando sus vecinas
+# libres dejan de estar unidas entre sí alrededor de ella, y esa búsqueda avanza
+# a la vez desde cada lado y se detiene en cuanto todos menos uno se encuentran
+# o se agotan.
+class Components:
+    def __init__(self, grid, labels=None):
+        self.grid = grid
+        if labels is None:
+            self.relabel()
+        else:
+            # Etiquetas ya calculadas (p. ej. en otro proceso), usadas sin copiar
+            self.version = grid.version
+            self.labels = labels
+            self.parent = list(range(int(labels.max(initial=0)) + 1))
+
+    def relabel(self):
+        # Etiquetado completo del mapa actual con NumPy. Cada tramo horizontal
+        # de celdas libres es un nodo; dos tramos de filas consecutivas se tocan
+        # si el inicio de uno queda a distancia 1 (en columna) de una celda del
+        # otro, y los grupos de tramos unidos se resuelven por enganche y
+        # acortamiento de punteros sobre arreglos, sin recorrer celda a celda.
+        grid = self.grid
+        rows, cols = grid.rows, grid.cols
+        self.version = grid.version
+        free = (grid.cells == 0).reshape(rows, cols)
+        starts = free.copy()
+        starts[:, 1:] &= ~free[:, :-1]
+        run = np.cumsum(starts.reshape(grid.size), dtype=np.int32)  # Tramo de cada celda
+        run[~free.reshape(grid.size)] = 0
+        free = free.reshape(grid.size)
+
+        first = np.flatnonzero(starts)
+        first_row, first_col = np.divmod(first, cols)
+        del starts
+        edges = []
+        for near_row, drow in ((first_row < rows - 1, cols), (first_row > 0, -cols)):
+            for dc in (-1, 0, 1):
+                keep = near_row & (first_col + dc >= 0) & (first_col + dc < cols)
+                source = first[keep]
+                target = source + drow + dc
+                touching = free[target]
+                edges.append((run[source[touching]], run[target[touching]]))
+        del first_row, first_col
+
+        # Cada raíz se engancha a la menor de las raíces con que se toca; los
+        # pares que ya comparten raíz no vuelven a mirarse
+        parent = np.arange(first.size + 1, dtype=np.int32)
+        while edges:
+            pending = []
+            for a, b in edges:
+                pa, pb = parent[a], parent[b]
+                differ = pa != pb
+                if differ.any():
+                    np.minimum.at(parent, np.maximum(pa[differ], pb[differ]), np.minimum(pa[differ], pb[differ]))
+                    pending.append((a[differ], b[differ]))
+            edges = pending
+            while True:
+                grand = parent[parent]
+                if np.array_equal(grand, parent):
+                    break
+                parent = grand
+
+        # Etiquetas consecutivas desde 1 para las raíces
+        roots = parent == np.arange(parent.size)
+        roots[0] = False
+        compact = np.cumsum(roots, dtype=np.int32)
+        self.labels = compact[parent][run]
+        self.parent = list(range(int(compact[-1]) + 1))
+
+    def _new_label(self):
+        self.parent.append(len(self.parent))
+        return len(self.parent) - 1
+
+    def _find(self, label):
+        parent = self.parent
+        root = label
+        while parent[root] != root:
+            root = parent[root]
+        while parent[label] != root:
+            parent[label], label = root, parent[label]
+        return root
+
+    def region(self, node):
+        # Identificador de la región de node (0 si es un obstáculo)
+        self._sync()
+        return self._find(self.labels.data[node])
+
+    def unreachable(self, start, end):
+        # True si start y end son celdas libres de regiones distintas
+        self._sync()
+        labels = self.labels.data
+        a, b = labels[start], labels[end]
+        return bool(a and b and self._find(a) != self._find(b))
+
+    def resolved(self):
+        # Etiquetas con cada región representada por una sola etiqueta, listas
+        # para pasarlas a Components(grid, labels) en otro proceso
+        self._sync()
+        roots = np.array([self._find(label) for label in range(len(self.parent))], dtype=np.int32)
+        return roots[self.labels]
+
+    def _sync(self):
+        grid = self.grid
+        changes = grid.changes_since(self.version)
+        if changes is None or len(changes) > grid.size // 16:
+            self.relabel()
+            return
+        self.version = grid.version
+        cells = grid.cells
+        labels = self.labels.data
+        # Cada cambio se aplica contra el estado final de la celda; si una celda
+        # cambió varias veces sólo cuenta la primera entrada que la diferencia
+        for node in changes:
+            if cells[node] and labels[node]:
+                if not self._remove(node):
+                    self.relabel()
+                    return
+            elif not cells[node] and not labels[node]:
+                self._add(node)
+
+    def _around(self, node):
+        # Vecinas etiquetadas de node
+        grid = self.grid
+        cols = grid.cols
+        labels = self.labels.data
+        row, col = divmod(node, cols)
+        for dr, dc in AROUND:
+            r, c = row + dr, col + dc
+            if 0 <= r < grid.rows and 0 <= c < cols and labels[r * cols + c]:
+                yield r * cols + c
+
+    def _add(self, node):
+        roots = {self._find(self.labels.data[neighbor]) for neighbor in self._around(node)}
+        if roots:
+            label = roots.pop()
+            for other in roots:
+                self.parent[other] = label
+        else:
+            label = self._new_label()
+        self.labels.data[node] = label
+
+    def _remove(self, node):
+        self.labels.data[node] = 0
+        ring = list(self._around(node))
+        cols = self.grid.cols
+        positions = [divmod(neighbor, cols) for neighbor in ring]
+
+        # Grupos de vecinas que siguen unidas entre sí sin pasar por node. Si
+        # hay más de uno hay que comprobar si la región se partió.
+        seeds = []
+        seen = set()
+        for i in range(len(ring)):
+            if i in seen:
+                continue
+            seeds.append(ring[i])
+            seen.add(i)
+            stack = [i]
+            while stack:
+                r, c = positions[stack.pop()]
+                for k, (kr, kc) in enumerate(positions):
+                    if k not in seen and abs(kr - r) <= 1 and abs(kc - c) <= 1:
+                        seen.add(k)
+                        stack.append(k)
+        return len(seeds) < 2 or self._split(seeds)
+
+    def _split(self, seeds):
+        # Búsqueda en anchura intercalada desde cada grupo. Dos grupos que se
+        # tocan pasan a ser el mismo; un grupo que se agota sin tocar a otro es
+        # una región nueva. Si hay que recorrer más de una fracción del mapa
+        # devuelve False: entonces sale más barato volver a etiquetar todo.
+        budget = self.grid.size // 16
+        group = list(range(len(seeds)))
+
+        def root(i):
+            while group[i] != i:
+                i = group[i]
+            return i
+
+        owner = {seed: i for i, seed in enumerate(seeds)}
+        queues = [deque([seed]) for seed in seeds]
+        visited = [[seed] for seed in seeds]
+        while True:
+            growing = {root(i) for i, queue in enumerate(queues) if queue}
+            if len(growing) <= 1:
+                break
+            for i, queue in enumerate(queues):
+                if not queue:
+                    continue
+                for neighbor in self._around(queue.popleft()):
+                    j = owner.get(neighbor)
+                    if j is None:
+                        if len(owner) > budget:
+                            return False
+                        owner[neighbor] = i
+                        queue.append(neighbor)
+                        visited[i].append(neighbor)
+                    elif root(j) != root(i):
+                        group[root(j)] = root(i)
+
+        # La región que sigue creciendo conserva su etiqueta; el resto recibe una
+        # nueva (si todas se agotaron, la conserva cualquiera de ellas)
+        roots = {root(i) for i in range(len(seeds))}
+        roots.discard(growing.pop() if growing else next(iter(roots)))
+        labels = self.labels.data
+        for region in roots:
+            label = self._new_label()
+            for i in range(len(seeds)):
+                if root(i) == region:
+                    for node in visited[i]:
+                        labels[node] = label
+        return True
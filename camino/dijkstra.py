@@ -0,0 +1,65 @@
+import time
+
+from .grid import DIRECTIONS
+from .search import SearchResult, reconstruct_path, search_stats, timed
+
+
+# Algoritmo de Dijkstra (script 4): todos los movimientos, incluidas las
+# diagonales, cuestan 1. Como los costos son enteros la lista abierta es una
+# cola de cubetas indexada por distancia; dentro de cada cubeta los nodos salen
+# en el orden en que entraron, igual que con (distancia, contador) en un heap.
+def dijkstra(grid, start, end, listener=None, directions=DIRECTIONS):
+    table = grid.neighbor_table(directions, 1)
+    mask = grid.mask.data
+    listener = timed(listener)
+
+    visited_nodes = 0
+    expanded = 0
+    stale = 0
+    start_time = time.time()
+    if grid.unreachable(start, end):
+        search_time = time.time() - start_time
+        return SearchResult(None, float("inf"), elapsed=search_time, stats=search_stats(search_time, listener, 0, 0))
+    buckets = [[start]]
+    # El estado sólo se guarda para los nodos alcanzados; el resto vale infinito
+    distances = {start: 0}
+    prev_node = {}
+    inf = float("inf")
+
+    current_distance = 0
+    while current_distance < len(buckets):
+        for current_node in buckets[current_distance]:
+            if distances[current_node] < current_distance:
+                stale += 1
+                continue  # Entrada obsoleta
+            if current_node == end:
+                path = reconstruct_path(prev_node, end, listener)
+                search_time = time.time() - start_time
+                stats = search_stats(search_time, listener, expanded, visited_nodes + 1, stale)
+                return SearchResult(path, distances[end], visited_nodes, search_time, expanded, stats)
+
+            expanded += 1
+            for offset, move_cost in table[mask[current_node]]:
+                neighbor = current_node + offset
+                temp_distance = current_distance + move_cost
+
+                if temp_distance < distances.get(neighbor, inf):
+                    distances[neighbor] = temp_distance
+                    prev_node[neighbor] = current_node
+                    while len(buckets) <= temp_distance:
+                        buckets.append([])
+                    buckets[temp_distance].append(neighbor)
+                    visited_nodes += 1
+                    if listener is not None:
+                        listener.opened(neighbor)
+
+            if listener is not None:
+                listener.closed(current_node)
+                listener.step()
+
+        buckets[current_distance] = None  # Liberar la cubeta ya procesada
+        current_distance += 1
+
+    search_time = time.time() - start_time
+    stats = search_stats(search_time, listener, expanded, visited_nodes + 1, stale)
+    return SearchResult(None, inf, visited_nodes, search_time, expanded, stats)
@@ -0,0 +1,196 @@
+import time
+from heapq import heappop, heappush
+
+from .grid import DIRECTIONS, SQRT2
+from .search import SearchResult, octile
+
+
+# Planificador incremental D* Lite (Koenig y Likhachev, versión optimizada).
+# Busca desde goal hacia start y conserva g/rhs entre llamadas: cuando cambian
+# celdas de la cuadrícula sólo se corrigen los nodos afectados y se vuelve a
+# propagar desde ellos, en lugar de buscar de nuevo desde cero. También admite
+# que start se desplace (un agente que avanza por el camino) sin perder lo
+# calculado. Los movimientos cuestan 1 en recta y diagonal en diagonal (√2 por
+# defecto, como astar; 1 con el modelo del script 4), y la heurística es la
+# octil con ese mismo costo diagonal, que nunca lo sobreestima.
+#
+# El objeto se puede usar como algoritmo en cualquier lugar que acepte astar:
+# al llamarlo con la misma cuadrícula y el mismo objetivo reutiliza la
+# búsqueda anterior, y con otros distintos empieza de nuevo.
+class DStarLite:
+    def __init__(self, diagonal=SQRT2):
+        self.diagonal = diagonal
+        self.grid = None
+        self.goal = None
+        self.listener = None  # Receptor de la planificación en curso
+        self.analyzed = 0  # Nodos abiertos en total, también entre reinicios
+
+    def __call__(self, grid, start, end, listener=None, directions=DIRECTIONS):
+        if grid is not self.grid or end != self.goal or directions != self.directions:
+            self.reset(grid, start, end, directions)
+        else:
+            self.move_start(start)
+        return self.plan(listener)
+
+    def reset(self, grid, start, goal, directions=DIRECTIONS):
+        self.grid = grid
+        self.start = start
+        self.goal = goal
+        self.directions = directions
+        self.version = grid.version
+        cols = grid.cols
+        self.steps = [(dr, dc, dr * cols + dc, 1 if dr == 0 or dc == 0 else self.diagonal)
+                      for dr, dc in directions]
+        self.km = 0
+        self.g = {}
+        self.rhs = {goal: 0}
+        self.open_set = []
+        self.open_set_hash = {}
+        self.count = 0
+        self._push(goal)
+
+    def move_start(self, start):
+        if start != self.start:
+            self.km += self._h(self.start, start)
+            self.start = start
+
+    # Nodos vecinos dentro de la cuadrícula con el costo de moverse a ellos
+    # (infinito si alguno de los dos extremos es un obstáculo)
+    def _neighbors(self, node):
+        grid = self.grid
+        cells = grid.cells
+        row, col = divmod(node, grid.cols)
+        blocked = cells[node]
+        for dr, dc, offset, cost in self.steps:
+            r, c = row + dr, col + dc
+            if 0 <= r < grid.rows and 0 <= c < grid.cols:
+                neighbor = node + offset
+                yield neighbor, float("inf") if blocked or cells[neighbor] else cost
+
+    def _h(self, a, b):
+        return octile(divmod(a, self.grid.cols), divmod(b, self.grid.cols), self.diagonal)
+
+    def _key(self, node):
+        inf = float("inf")
+        m = min(self.g.get(node, inf), self.rhs.get(node, inf))
+        return (m + self._h(self.start, node) + self.km, m)
+
+    def _push(self, node):
+        self.count += 1
+        k1, k2 = self._key(node)
+        heappush(self.open_set, (k1, k2, self.count, node))
+        if node not in self.open_set_hash:
+            self.analyzed += 1
+            if self.listener is not None:
+                self.listener.opened(node)
+        self.open_set_hash[node] = self.count
+
+    def _top(self):
+        open_set, live = self.open_set, self.open_set_hash
+        while open_set and live.get(open_set[0][3]) != open_set[0][2]:
+            heappop(open_set)  # Entrada obsoleta
+        if not open_set:
+            return None
+        return open_set[0]
+
+    def _update_vertex(self, node):
+        inf = float("inf")
+        if node != self.goal:
+            self.rhs[node] = min((cost + self.g.get(n, inf) for n, cost in self._neighbors(node)), default=inf)
+        if self.g.get(node, inf) != self.rhs.get(node, inf):
+            self._push(node)
+        else:
+            self.open_set_hash.pop(node, None)
+
+    def _sync(self):
+        # Incorpora las celdas editadas desde la última planificación
+        changes = self.grid.changes_since(self.version)
+        if changes is None:
+            self.reset(self.grid, self.start, self.goal, self.directions)
+            return
+        self.version = self.grid.version
+        affected = set()
+        for node in changes:
+            affected.add(node)
+            affected.update(n for n, _ in self._neighbors(node))
+        for node in affected:
+            self._update_vertex(node)
+
+    def plan(self, listener=None):
+        start_time = time.time()
+        analyzed_before = self.analyzed
+        self.listener = listener
+        self._sync()
+        expanded = 0
+        inf = float("inf")
+        if self.grid.unreachable(self.start, self.goal):
+            self.listener = None
+            return SearchResult(None, inf, elapsed=time.time() - start_time)
+        g, rhs = self.g, self.rhs
+
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            start_key = self._key(self.start)
+            if (top[0], top[1]) >= start_key and rhs.get(self.start, inf) <= g.get(self.start, inf):
+                break
+            k_old = (top[0], top[1])
+            node = top[3]
+            k_new = self._key(node)
+            if k_old < k_new:
+                self._push(node)
+                continue
+            del self.open_set_hash[node]
+            expanded += 1
+            if g.get(node, inf) > rhs.get(node, inf):
+                g[node] = rhs[node]
+                for neighbor, cost in self._neighbors(node):
+                    if neighbor != self.goal and cost + g[node] < rhs.get(neighbor, inf):
+                        rhs[neighbor] = cost + g[node]
+                        self._update_vertex_key(neighbor)
+            else:
+                g[node] = inf
+                self._update_vertex(node)
+                for neighbor, _ in self._neighbors(node):
+                    self._update_vertex(neighbor)
+            if listener is not None:
+                listener.closed(node)
+                listener.step()
+
+        self.listener = None
+        path = self.path()
+        cost = rhs.get(self.start, inf) if path is not None else inf
+        if listener is not None and path is not None:
+            for node in reversed(path[:-1]):
+                listener.path(node)
+        return SearchResult(path, cost, self.analyzed - analyzed_before, time.time() - start_time, expanded)
+
+    def _update_vertex_key(self, node):
+        # Como _update_vertex pero con rhs ya actualizado por el llamador
+        if self.g.get(node, float("inf")) != self.rhs[node]:
+            self._push(node)
+        else:
+            self.open_set_hash.pop(node, None)
+
+    def path(self):
+        # Sigue desde start el vecino que minimiza costo + g hasta llegar a goal.
+        # Al terminar plan, start puede quedar sobreconsistente: su costo real es
+        # rhs, no g.
+        inf = float("inf")
+        g = self.g
+        node = self.start
+        if self.rhs.get(node, inf) == inf:
+            return None
+        path = [node]
+        while node != self.goal:
+            best, best_cost = None, inf
+            for neighbor, cost in self._neighbors(node):
+                total = cost + g.get(neighbor, inf)
+                if total < best_cost:
+                    best, best_cost = neighbor, total
+            if best is None:
+                return None
+            node = best
+            path.append(node)
+        return path
@@ -0,0 +1,132 @@
+from heapq import heappop, heappush
+
+import numpy as np
+
+from .grid import DIRECTIONS
+
+
+# Dijkstra desde goal sobre todo el mapa, sin condición de parada. Devuelve la
+# distancia de cada celda a goal (inf si no lo alcanza) y, para cada celda, el
+# siguiente nodo hacia goal (-1 en goal y en las celdas inalcanzables). Como los
+# movimientos son simétricos, la distancia desde goal es la distancia hacia él.
+# Por defecto todos los movimientos cuestan 1, como en el script 4, y entonces
+# el cálculo lo hace wavefront.
+def distance_field(grid, goal, directions=DIRECTIONS, diagonal=1):
+    if diagonal == 1:
+        return wavefront(grid, goal, directions)
+    table = grid.neighbor_table(directions, diagonal)
+    mask = grid.mask.data
+
+    distances = {goal: 0}
+    next_node = {}
+    open_set = [(0, goal)]
+    while open_set:
+        current_distance, current = heappop(open_set)
+        if current_distance > distances[current]:
+            continue  # Entrada obsoleta
+        for offset, move_cost in table[mask[current]]:
+            neighbor = current + offset
+            temp_distance = current_distance + move_cost
+            if temp_distance < distances.get(neighbor, float("inf")):
+                distances[neighbor] = temp_distance
+                next_node[neighbor] = current
+                heappush(open_set, (temp_distance, neighbor))
+
+    dist = np.full(grid.size, np.inf)
+    dist[np.fromiter(distances.keys(), np.int64, len(distances))] = list(distances.values())
+    flow = np.full(grid.size, -1, dtype=np.int32)
+    flow[np.fromiter(next_node.keys(), np.int64, len(next_node))] = list(next_node.values())
+    return dist, flow
+
+
+# Búsqueda en anchura desde goal con costo 1 en todos los movimientos, avanzando
+# un anillo completo por paso con operaciones de NumPy sobre los índices del
+# frente en lugar de un nodo por iteración. Devuelve lo mismo que el Dijkstra de
+# distance_field, incluido flow: allí el primer nodo que alcanza a una celda es
+# el de menor índice entre los de la distancia anterior, y aquí se elige igual.
+def wavefront(grid, goal, directions=DIRECTIONS):
+    cols, size = grid.cols, grid.size
+    mask = grid.mask
+    steps = [(1 << DIRECTIONS.index((dr, dc)), dr * cols + dc) for dr, dc in directions]
+
+    level = np.full(size, -1, dtype=np.int32)
+    level[goal] = 0
+    slot = np.empty(size, dtype=np.int64)  # Para quitar repetidos sin ordenar
+    frontier = np.array([goal], dtype=np.int64)
+    distance = 0
+    while frontier.size:
+        distance += 1
+        bits = mask[frontier]
+        reached = np.concatenate([frontier[bits & bit != 0] + offset for bit, offset in steps])
+        reached = reached[level[reached] < 0]
+        order = np.arange(reached.size)
+        slot[reached] = order
+        reached = reached[slot[reached] == order]
+        level[reached] = distance
+        frontier = reached
+
+    # Siguiente nodo hacia goal: el vecino de menor índice un nivel más abajo
+    # desde el que el movimiento es válido
+    nodes = np.flatnonzero(level > 0)
+    best = np.full(nodes.size, size, dtype=np.int64)
+    for bit, offset in steps:
+        prev = nodes - offset
+        valid = (prev >= 0) & (prev < size)
+        prev = np.where(valid, prev, 0)
+        valid &= (level[prev] == level[nodes] - 1) & (mask[prev] & bit != 0)
+        best = np.where(valid, np.minimum(best, prev), best)
+
+    dist = np.where(level < 0, np.inf, level.astype(np.float64))
+    flow = np.full(size, -1, dtype=np.int32)
+    flow[nodes] = best
+    return dist, flow
+
+
+# Campo de distancias hacia un objetivo fijo. Una vez calculado, el camino
+# desde cualquier celda se lee siguiendo flow en O(longitud del camino), sin
+# volver a buscar. Sigue siendo válido mientras no cambie grid.version.
+class DistanceField:
+    def __init__(self, grid, goal, directions=DIRECTIONS, diagonal=1):
+        self.grid = grid
+        self.goal = goal
+        self.version = grid.version
+        self.dist, self.flow = distance_field(grid, goal, directions, diagonal)
+
+    def is_valid(self):
+        return self.version == self.grid.version
+
+    def cost(self, start):
+        return float(self.dist[start])
+
+    def path(self, start):
+        if self.dist[start] == np.inf:
+            return None
+        flow = self.flow
+        path = [start]
+        while start != self.goal:
+            start = int(flow[start])
+            path.append(start)
+        return path
+
+
+# Campos de distancia por objetivo, reutilizados mientras el mapa no cambie.
+# Guarda como mucho maxsize campos y descarta primero el menos usado.
+class FieldCache:
+    def __init__(self, grid, maxsize=16, directions=DIRECTIONS, diagonal=1):
+        self.grid = grid
+        self.maxsize = maxsize
+        self.directions = directions
+        self.diagonal = diagonal
+        self.fields = {}
+
+    def get(self, goal):
+        field = self.fields.pop(goal, None)
+        if field is None or not field.is_valid():
+            field = DistanceField(self.grid, goal, self.directions, self.diagonal)
+        self.fields[goal] = field
+        while len(self.fields) > self.maxsize:
+            del self.fields[next(iter(self.fields))]
+        return field
+
+    def path(self, start, goal):
+        return self.get(goal).path(start)
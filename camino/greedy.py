@@ -0,0 +1,66 @@
+import time
+from heapq import heappop, heappush
+
+from .grid import DIRECTIONS
+from .search import SearchResult, heuristic, reconstruct_path, search_stats, timed
+
+
+# Búsqueda voraz primero el mejor (scripts 3 y 5). La prioridad de cada vecino es
+# el costo del movimiento más la heurística, y una celda abierta no se actualiza.
+# La lista abierta es un heap de (prioridad, orden de inserción, nodo): a igual
+# prioridad sale primero el nodo abierto antes, como con el ordenamiento estable
+# del script 3 y el mínimo sobre el diccionario del script 5. Entre ambos sólo
+# cambia el orden de vecinos (directions).
+def greedy(grid, start, end, listener=None, directions=DIRECTIONS):
+    table = grid.neighbor_table(directions)
+    mask = grid.mask.data
+    listener = timed(listener)
+    cols = grid.cols
+    end_pos = grid.pos(end)
+
+    analyzed_coords = 0
+    open_set = [(0, 0, start)]
+    open_set_hash = {start}
+    came_from = {}
+    closed_set = set()
+    cost = {start: 0}
+    start_time = time.time()
+    if grid.unreachable(start, end):
+        elapsed_time = time.time() - start_time
+        return SearchResult(None, float("inf"), elapsed=elapsed_time, stats=search_stats(elapsed_time, listener, 0, 0))
+
+    while open_set:
+        current = heappop(open_set)[2]
+        open_set_hash.remove(current)
+
+        if current == end:
+            path = reconstruct_path(came_from, end, listener)
+            elapsed_time = time.time() - start_time
+            # Un nodo abierto no se vuelve a insertar, así que no hay entradas
+            # obsoletas y cada inserción salvo la de start evalúa la heurística
+            stats = search_stats(elapsed_time, listener, len(closed_set), analyzed_coords + 1, 0, analyzed_coords)
+            return SearchResult(path, cost[end], analyzed_coords, elapsed_time, len(closed_set), stats)
+
+        closed_set.add(current)
+        for offset, move_cost in table[mask[current]]:
+            neighbor = current + offset
+            if neighbor in closed_set:
+                continue
+
+            if neighbor not in open_set_hash:
+                total_cost = move_cost + heuristic(divmod(neighbor, cols), end_pos)
+                came_from[neighbor] = current
+                cost[neighbor] = cost[current] + move_cost
+                analyzed_coords += 1
+                heappush(open_set, (total_cost, analyzed_coords, neighbor))
+                open_set_hash.add(neighbor)
+                if listener is not None:
+                    listener.opened(neighbor)
+
+        if listener is not None:
+            listener.closed(current)
+            listener.step()
+
+    elapsed_time = time.time() - start_time
+    stats = search_stats(elapsed_time, listener, len(closed_set), analyzed_coords + 1, 0, analyzed_coords)
+    return SearchResult(None, float("inf"), analyzed_coords, elapsed_time, len(closed_set), stats)
@@ -0,0 +1,173 @@
+import math
+
+import numpy as np
+
+from .components import Components
+
+# Direcciones de movimiento en el orden en que las recorren los scripts 2 y 3.
+# El bit k de la máscara de vecinos corresponde a DIRECTIONS[k].
+DIRECTIONS = (
+    (0, 1), (1, 0), (0, -1), (-1, 0),  # Horizontal y vertical
+    (-1, -1), (-1, 1), (1, -1), (1, 1)  # Diagonales
+)
+
+# Orden usado por los scripts 4 y 5 (abajo, arriba, derecha, izquierda y diagonales)
+DIRECTIONS_ALT = (
+    (1, 0), (-1, 0), (0, 1), (0, -1),
+    (1, 1), (1, -1), (-1, 1), (-1, -1)
+)
+
+# Bit de la dirección contraria a DIRECTIONS[k]
+OPPOSITE = tuple(DIRECTIONS.index((-dr, -dc)) for dr, dc in DIRECTIONS)
+
+SQRT2 = math.sqrt(2)
+
+
+# Cuadrícula de obstáculos independiente de cualquier interfaz gráfica.
+# Las celdas se guardan en un arreglo uint8 contiguo (1 = obstáculo) y cada
+# nodo se identifica por su índice plano fila * cols + columna. La máscara de
+# vecinos se corrige localmente en make_obstacle/reset; sólo quien escriba
+# directamente en cells o array debe llamar a update_neighbors. version aumenta
+# con cada cambio de obstáculos, para invalidar datos calculados sobre el mapa,
+# y changes_since permite a esos datos ponerse al día celda por celda.
+#
+# cells y mask pueden venir de fuera (memoria compartida, archivos mapeados);
+# se usan tal cual, sin copiarlos. labels, si se da, son las etiquetas de
+# regiones ya resueltas de ese mapa (Components.resolved).
+class Grid:
+    JOURNAL_LIMIT = 1 << 16  # Cambios recordados por changes_since
+
+    def __init__(self, rows, cols=None, cells=None, mask=None, labels=None):
+        self.rows = rows
+        self.cols = rows if cols is None else cols
+        self.size = self.rows * self.cols
+        self.cells = np.zeros(self.size, dtype=np.uint8) if cells is None else cells
+        self.version = 0
+        self._journal = []
+        self._journal_base = 0
+        self._tables = {}
+        if mask is None:
+            self.update_neighbors()
+        else:
+            self.mask = mask
+        self._components = None if labels is None else Components(self, labels)
+
+    @property
+    def array(self):
+        # Vista 2D (fila, columna) de los obstáculos, sin copia
+        return self.cells.reshape(self.rows, self.cols)
+
+    @property
+    def components(self):
+        # Índice de regiones conexas, calculado en la primera consulta
+        return self.build_components()
+
+    def build_components(self):
+        # Calcula el índice de regiones si todavía no existe y lo devuelve. A
+        # partir de entonces unreachable lo consulta y las ediciones lo
+        # mantienen al día.
+        if self._components is None:
+            self._components = Components(self)
+        return self._components
+
+    def unreachable(self, start, end):
+        # True si el índice de regiones ya está calculado y dice que start y end
+        # no están conectados. No lo calcula: etiquetar el mapa entero cuesta más
+        # que una consulta corta, así que se construye aparte (build_components,
+        # solve_batch) cuando hay muchas consultas que lo amortizan.
+        return self._components is not None and self._components.unreachable(start, end)
+
+    def index(self, pos):
+        return pos[0] * self.cols + pos[1]
+
+    def pos(self, node):
+        return divmod(node, self.cols)
+
+    def in_bounds(self, pos):
+        row, col = pos
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def is_obstacle(self, node):
+        return self.cells[node] != 0
+
+    def make_obstacle(self, node):
+        if not self.cells[node]:
+            self.cells[node] = 1
+            self._record(node)
+            self._patch_neighbors(node, False)
+
+    def reset(self, node):
+        if self.cells[node]:
+            self.cells[node] = 0
+            self._record(node)
+            self._patch_neighbors(node, True)
+
+    def clear(self):
+        self.cells[:] = 0
+        self.update_neighbors()
+
+    def _record(self, node):
+        self.version += 1
+        self._journal.append(node)
+        if len(self._journal) > self.JOURNAL_LIMIT:
+            drop = len(self._journal) // 2
+            del self._journal[:drop]
+            self._journal_base += drop
+
+    def changes_since(self, version):
+        # Celdas que cambiaron de estado desde version, o None si ya no se
+        # recuerdan (cambio masivo con update_neighbors o historial recortado)
+        if version < self._journal_base:
+            return None
+        return self._journal[version - self._journal_base:]
+
+    def _patch_neighbors(self, node, free):
+        # Actualiza en los 8 vecinos el bit que apunta hacia node
+        row, col = divmod(node, self.cols)
+        mask = self.mask
+        for bit, (dr, dc) in enumerate(DIRECTIONS):
+            r, c = row + dr, col + dc
+            if 0 <= r < self.rows and 0 <= c < self.cols:
+                back = 1 << OPPOSITE[bit]
+                neighbor = r * self.cols + c
+                if free:
+                    mask[neighbor] |= back
+                else:
+                    mask[neighbor] &= ~back & 0xFF
+
+    def update_neighbors(self):
+        # Recalcula la máscara de vecinos libres de todas las celdas
+        self.version += 1
+        self._journal = []
+        self._journal_base = self.version
+        free = self.array == 0
+        mask = np.zeros((self.rows, self.cols), dtype=np.uint8)
+        for bit, (dr, dc) in enumerate(DIRECTIONS):
+            dst = mask[max(0, -dr):self.rows - max(0, dr), max(0, -dc):self.cols - max(0, dc)]
+            src = free[max(0, dr):self.rows + min(0, dr), max(0, dc):self.cols + min(0, dc)]
+            dst |= src.astype(np.uint8) << bit
+        self.mask = mask.reshape(self.size)
+
+    def neighbor_table(self, directions=DIRECTIONS, diagonal=SQRT2):
+        # Para cada valor de máscara, la tupla de (desplazamiento, costo) de los
+        # vecinos libres en el orden de directions
+        key = (directions, diagonal)
+        table = self._tables.get(key)
+        if table is None:
+            steps = []
+            for d in directions:
+                bit = 1 << DIRECTIONS.index(d)
+                cost = 1 if d[0] == 0 or d[1] == 0 else diagonal
+                steps.append((bit, d[0] * self.cols + d[1], cost))
+            table = [tuple((offset, cost) for bit, offset, cost in steps if m & bit) for m in range(256)]
+            self._tables[key] = table
+        return table
+
+    @classmethod
+    def from_rows(cls, lines, wall="#"):
+        # Construye una cuadrícula a partir de filas de texto ('#' = obstáculo)
+        lines = [line for line in lines if line]
+        grid = cls(len(lines), len(lines[0]))
+        grid.array[:] = np.array([[char == wall for char in line] for line in lines], dtype=np.uint8)
+        grid.update_neighbors()
+        return grid
@@ -0,0 +1,285 @@
+import time
+from heapq import heappop, heappush
+
+from .grid import DIRECTIONS
+from .search import SearchResult, heuristic
+
+
+# Búsqueda jerárquica HPA* (Botea, Müller y Schaeffer) con los costos de astar:
+# 1 en recta y √2 en diagonal. La cuadrícula se divide en bloques de size x size
+# celdas. En la frontera entre dos bloques vecinos (también los que sólo se
+# tocan por una esquina) se eligen celdas de entrada, y dentro de cada bloque se
+# guardan los caminos mínimos entre sus entradas. Una consulta une start y end
+# con las entradas de su bloque, busca con A* sobre ese grafo abstracto y
+# concatena los tramos guardados. Encuentra camino siempre que exista, pero su
+# costo puede ser algo mayor que el óptimo porque pasa por las entradas.
+#
+# Los bloques se calculan la primera vez que una búsqueda los necesita (o todos
+# de una vez con build) y se descartan cuando cambia una celda suya o de su
+# borde, de modo que editar el mapa sólo obliga a rehacer los bloques tocados.
+# Como DStarLite, el objeto se puede pasar donde se acepte astar.
+class HPAStar:
+    LONG_ENTRANCE = 6  # Desde este largo una entrada usa sus dos extremos
+
+    def __init__(self, size=16):
+        self.size = size
+        self.grid = None
+        self.directions = None
+
+    def __call__(self, grid, start, end, listener=None, directions=DIRECTIONS):
+        if grid is not self.grid or directions != self.directions:
+            self.reset(grid, directions)
+        return self.search(start, end, listener)
+
+    def reset(self, grid, directions=DIRECTIONS):
+        self.grid = grid
+        self.directions = directions
+        self.version = grid.version
+        self.table = grid.neighbor_table(directions)
+        self.cluster_rows = -(-grid.rows // self.size)
+        self.cluster_cols = -(-grid.cols // self.size)
+        self.borders = {}  # (bloque, bloque) -> [(entrada, entrada, costo)]
+        self.graphs = {}  # bloque -> {entrada: [(vecino, costo, tramo)]}
+
+    def build(self, grid, directions=DIRECTIONS):
+        # Preprocesa todos los bloques en lugar de esperar a las consultas
+        if grid is not self.grid or directions != self.directions:
+            self.reset(grid, directions)
+        self._sync()
+        for cluster in range(self.cluster_rows * self.cluster_cols):
+            self._graph(cluster)
+
+    def _cluster(self, node):
+        row, col = divmod(node, self.grid.cols)
+        return (row // self.size) * self.cluster_cols + col // self.size
+
+    def _bounds(self, cluster):
+        i, j = divmod(cluster, self.cluster_cols)
+        r0, c0 = i * self.size, j * self.size
+        return r0, min(r0 + self.size, self.grid.rows), c0, min(c0 + self.size, self.grid.cols)
+
+    def _adjacent(self, cluster):
+        i, j = divmod(cluster, self.cluster_cols)
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                if (di or dj) and 0 <= i + di < self.cluster_rows and 0 <= j + dj < self.cluster_cols:
+                    yield (i + di) * self.cluster_cols + j + dj
+
+    def _strip(self, cluster, other):
+        # Celdas de cluster que tocan al bloque vecino other (una fila, una
+        # columna o la celda de la esquina)
+        i, j = divmod(cluster, self.cluster_cols)
+        oi, oj = divmod(other, self.cluster_cols)
+        r0, r1, c0, c1 = self._bounds(cluster)
+        rows = range(r0, r1) if oi == i else (r1 - 1 if oi > i else r0,)
+        cols = range(c0, c1) if oj == j else (c1 - 1 if oj > j else c0,)
+        return [r * self.grid.cols + c for r in rows for c in cols]
+
+    def _runs(self, strip):
+        # Numera los tramos de celdas libres consecutivas de strip
+        cells = self.grid.cells
+        label = {}
+        run = 0
+        previous_free = False
+        for node in strip:
+            if cells[node]:
+                previous_free = False
+                continue
+            if not previous_free:
+                run += 1
+            label[node] = run
+            previous_free = True
+        return label
+
+    def _entrances(self, cluster, other):
+        # Movimientos que cruzan la frontera, agrupados por el tramo libre de
+        # cada lado. Dentro de un grupo todas las celdas de un lado están
+        # conectadas por su tramo, así que basta con uno o dos representantes
+        # por grupo para no perder ningún camino.
+        mask = self.grid.mask.data
+        table = self.table
+        own = self._runs(self._strip(cluster, other))
+        their = self._runs(self._strip(other, cluster))
+        groups = {}
+        for a, run in own.items():
+            for offset, cost in table[mask[a]]:
+                b = a + offset
+                if b in their:
+                    groups.setdefault((run, their[b]), []).append((a, b, cost))
+
+        entrances = []
+        for moves in groups.values():
+            if len(moves) >= self.LONG_ENTRANCE:
+                entrances += (moves[0], moves[-1])
+            else:
+                entrances.append(moves[len(moves) // 2])
+        return entrances
+
+    def _local(self, source, cluster):
+        # Dijkstra desde source sin salir del bloque
+        r0, r1, c0, c1 = self._bounds(cluster)
+        cols = self.grid.cols
+        inside = {r * cols + c for r in range(r0, r1) for c in range(c0, c1)}
+        mask = self.grid.mask.data
+        table = self.table
+        inf = float("inf")
+        distances = {source: 0}
+        prev_node = {}
+        open_set = [(0, source)]
+        while open_set:
+            current_distance, current = heappop(open_set)
+            if current_distance > distances[current]:
+                continue  # Entrada obsoleta
+            for offset, move_cost in table[mask[current]]:
+                neighbor = current + offset
+                temp_distance = current_distance + move_cost
+                if neighbor in inside and temp_distance < distances.get(neighbor, inf):
+                    distances[neighbor] = temp_distance
+                    prev_node[neighbor] = current
+                    heappush(open_set, (temp_distance, neighbor))
+        return distances, prev_node
+
+    @staticmethod
+    def _route(prev_node, node):
+        # Tramo desde el origen de _local hasta node
+        route = [node]
+        while node in prev_node:
+            node = prev_node[node]
+            route.append(node)
+        route.reverse()
+        return route
+
+    def _graph(self, cluster):
+        # Entradas del bloque con sus aristas: tramos internos hacia las demás
+        # entradas y movimientos que cruzan a los bloques vecinos (tramo None).
+        # El tramo interno se guarda como el árbol de _local desde la entrada y
+        # sólo se convierte en lista de celdas si el camino final lo usa.
+        graph = self.graphs.get(cluster)
+        if graph is not None:
+            return graph
+
+        links = {}
+        for other in self._adjacent(cluster):
+            key = (min(cluster, other), max(cluster, other))
+            border = self.borders.get(key)
+            if border is None:
+                border = self.borders[key] = self._entrances(*key)
+            for a, b, cost in border:
+                if cluster > other:
+                    a, b = b, a
+                links.setdefault(a, []).append((b, cost, None))
+
+        graph = {}
+        for node, crossings in links.items():
+            distances, prev_node = self._local(node, cluster)
+            graph[node] = [(other, distances[other], prev_node)
+                           for other in links if other != node and other in distances] + crossings
+        self.graphs[cluster] = graph
+        return graph
+
+    def _sync(self):
+        # Descarta los bloques y fronteras afectados por las celdas editadas
+        grid = self.grid
+        changes = grid.changes_since(self.version)
+        if changes is None:
+            self.reset(grid, self.directions)
+            return
+        self.version = grid.version
+        for node in changes:
+            row, col = divmod(node, grid.cols)
+            touched = {self._cluster(r * grid.cols + c)
+                       for r in range(max(row - 1, 0), min(row + 2, grid.rows))
+                       for c in range(max(col - 1, 0), min(col + 2, grid.cols))}
+            for cluster in touched:
+                self.graphs.pop(cluster, None)
+                for other in touched:
+                    self.borders.pop((cluster, other), None)
+
+    def search(self, start, end, listener=None):
+        self._sync()
+        start_time = time.time()
+        inf = float("inf")
+        if self.grid.unreachable(start, end):
+            return SearchResult(None, inf, elapsed=time.time() - start_time)
+        cols = self.grid.cols
+        end_pos = divmod(end, cols)
+
+        # Une start y end con las entradas de sus bloques
+        start_cluster, end_cluster = self._cluster(start), self._cluster(end)
+        start_graph, end_graph = self._graph(start_cluster), self._graph(end_cluster)
+        distances, prev_node = self._local(start, start_cluster)
+        start_edges = [(node, distances[node], prev_node)
+                       for node in start_graph if node != start and node in distances]
+        if start_cluster == end_cluster and end in distances:
+            start_edges.append((end, distances[end], prev_node))
+        start_edges += start_graph.get(start, ())
+        distances, prev_node = self._local(end, end_cluster)
+        goal_edges = {node: (end, distances[node], self._route(prev_node, node)[::-1])
+                      for node in end_graph if node in distances}
+
+        count = 0
+        analyzed = 0
+        expanded = 0
+        open_set = [(heuristic(divmod(start, cols), end_pos), count, start)]
+        open_set_hash = {start: count}
+        came_from = {}
+        g_score = {start: 0}
+
+        while open_set:
+            _, entry, current = heappop(open_set)
+            if open_set_hash.get(current) != entry:
+                continue  # Entrada obsoleta
+            del open_set_hash[current]
+
+            if current == end:
+                path = self._refine(came_from, start, end)
+                if listener is not None:
+                    for node in reversed(path[:-1]):
+                        listener.path(node)
+                return SearchResult(path, g_score[end], analyzed, time.time() - start_time, expanded)
+
+            expanded += 1
+            if current == start:
+                edges = start_edges
+            else:
+                edges = self._graph(self._cluster(current))[current]
+            if current in goal_edges:
+                edges = edges + [goal_edges[current]]
+            for neighbor, move_cost, route in edges:
+                tentative_g_score = g_score[current] + move_cost
+                if tentative_g_score < g_score.get(neighbor, inf):
+                    came_from[neighbor] = (current, route)
+                    g_score[neighbor] = tentative_g_score
+                    f_score = tentative_g_score + heuristic(divmod(neighbor, cols), end_pos)
+                    count += 1
+                    heappush(open_set, (f_score, count, neighbor))
+                    if neighbor not in open_set_hash:
+                        analyzed += 1
+                        if listener is not None:
+                            listener.opened(neighbor)
+                    open_set_hash[neighbor] = count
+
+            if listener is not None:
+                listener.closed(current)
+                listener.step()
+
+        return SearchResult(None, inf, analyzed, time.time() - start_time, expanded)
+
+    @staticmethod
+    def _refine(came_from, start, end):
+        # Camino completo de celdas a partir de los tramos del grafo abstracto:
+        # un árbol de _local con raíz en el nodo anterior, una lista de celdas
+        # (tramos hacia end) o None para un movimiento entre bloques
+        path = [end]
+        node = end
+        while node != start:
+            parent, route = came_from[node]
+            if route is None:
+                path.append(parent)
+            elif isinstance(route, dict):
+                path.extend(HPAStar._route(route, node)[-2::-1])
+            else:
+                path.extend(route[-2::-1])
+            node = parent
+        path.reverse()
+        return path
@@ -0,0 +1,154 @@
+import time
+from heapq import heappop, heappush
+
+from .grid import DIRECTIONS, SQRT2
+from .search import SearchResult, heuristic, reconstruct_path
+
+
+def _sign(value):
+    return (value > 0) - (value < 0)
+
+
+# Búsqueda por puntos de salto (Jump Point Search) sobre la misma cuadrícula de
+# 8 direcciones y costos 1/√2 que astar, incluido el paso en diagonal entre dos
+# obstáculos. En lugar de abrir cada vecino se avanza en línea recta o en
+# diagonal hasta un punto con vecinos forzados (o el objetivo), así que el heap
+# sólo contiene puntos de salto. Los costos de los caminos son los de astar.
+# Las reglas de poda suponen los 8 movimientos: directions sólo se acepta por
+# compatibilidad con los demás algoritmos (DIRECTIONS o DIRECTIONS_ALT, el
+# orden de exploración lo fijan las reglas de poda) y otro conjunto es un error.
+def jps(grid, start, end, listener=None, directions=DIRECTIONS):
+    if set(directions) != set(DIRECTIONS):
+        raise ValueError("jps necesita las 8 direcciones de movimiento")
+    rows, cols = grid.rows, grid.cols
+    cells = grid.cells.data
+    end_row, end_col = end_pos = grid.pos(end)
+
+    def walkable(r, c):
+        return 0 <= r < rows and 0 <= c < cols and not cells[r * cols + c]
+
+    def jump_straight(r, c, dr, dc):
+        while walkable(r, c):
+            if r == end_row and c == end_col:
+                return r, c
+            if dr:
+                if (walkable(r + dr, c + 1) and not walkable(r, c + 1)) or \
+                        (walkable(r + dr, c - 1) and not walkable(r, c - 1)):
+                    return r, c
+            elif (walkable(r + 1, c + dc) and not walkable(r + 1, c)) or \
+                    (walkable(r - 1, c + dc) and not walkable(r - 1, c)):
+                return r, c
+            r += dr
+            c += dc
+        return None
+
+    def jump(r, c, dr, dc):
+        if not dr or not dc:
+            return jump_straight(r, c, dr, dc)
+        while walkable(r, c):
+            if r == end_row and c == end_col:
+                return r, c
+            if (walkable(r - dr, c + dc) and not walkable(r - dr, c)) or \
+                    (walkable(r + dr, c - dc) and not walkable(r, c - dc)):
+                return r, c
+            if jump_straight(r + dr, c, dr, 0) or jump_straight(r, c + dc, 0, dc):
+                return r, c
+            r += dr
+            c += dc
+        return None
+
+    def successors(node):
+        r, c = divmod(node, cols)
+        parent = came_from.get(node)
+        if parent is None:
+            return [(r + dr, c + dc, dr, dc) for dr, dc in directions]
+        pr, pc = divmod(parent, cols)
+        dr, dc = _sign(r - pr), _sign(c - pc)
+        if dr and dc:
+            moves = [(0, dc), (dr, 0), (dr, dc)]
+            if not walkable(r - dr, c):
+                moves.append((-dr, dc))
+            if not walkable(r, c - dc):
+                moves.append((dr, -dc))
+        elif dr:
+            moves = [(dr, 0)]
+            if not walkable(r, c + 1):
+                moves.append((dr, 1))
+            if not walkable(r, c - 1):
+                moves.append((dr, -1))
+        else:
+            moves = [(0, dc)]
+            if not walkable(r + 1, c):
+                moves.append((1, dc))
+            if not walkable(r - 1, c):
+                moves.append((-1, dc))
+        return [(r + mr, c + mc, mr, mc) for mr, mc in moves]
+
+    count = 0
+    analyzed = 0
+    expanded = 0
+    open_set = [(0, count, start)]
+    open_set_hash = {start: count}
+    came_from = {}
+    g_score = {start: 0}
+    inf = float("inf")
+    start_time = time.time()
+    if grid.unreachable(start, end):
+        return SearchResult(None, inf, elapsed=time.time() - start_time)
+
+    while open_set:
+        _, entry, current = heappop(open_set)
+        if open_set_hash.get(current) != entry:
+            continue  # Entrada obsoleta
+        del open_set_hash[current]
+
+        if current == end:
+            path = fill_path(grid, reconstruct_path(came_from, end), listener)
+            elapsed_time = time.time() - start_time
+            return SearchResult(path, g_score[end], analyzed, elapsed_time, expanded)
+
+        expanded += 1
+        row, col = divmod(current, cols)
+        for r, c, dr, dc in successors(current):
+            point = jump(r, c, dr, dc)
+            if point is None:
+                continue
+            neighbor = point[0] * cols + point[1]
+            steps = max(abs(point[0] - row), abs(point[1] - col))
+            tentative_g_score = g_score[current] + steps * (SQRT2 if dr and dc else 1)
+
+            if tentative_g_score < g_score.get(neighbor, inf):
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                f_score = tentative_g_score + heuristic(point, end_pos)
+                count += 1
+                heappush(open_set, (f_score, count, neighbor))
+                if neighbor not in open_set_hash:
+                    analyzed += 1
+                    if listener is not None:
+                        listener.opened(neighbor)
+                open_set_hash[neighbor] = count
+
+        if listener is not None:
+            listener.closed(current)
+            listener.step()
+
+    return SearchResult(None, inf, analyzed, time.time() - start_time, expanded)
+
+
+# Completa las celdas intermedias entre puntos de salto consecutivos, que
+# siempre están alineados en recta o en diagonal. Avisa al receptor de cada
+# celda del camino salvo el final, igual que reconstruct_path.
+def fill_path(grid, jump_points, listener=None):
+    cols = grid.cols
+    path = jump_points[:1]
+    for node in jump_points[1:]:
+        r, c = divmod(path[-1], cols)
+        nr, nc = divmod(node, cols)
+        step = _sign(nr - r) * cols + _sign(nc - c)
+        for _ in range(max(abs(nr - r), abs(nc - c))):
+            path.append(path[-1] + step)
+    if listener is not None:
+        for node in reversed(path[:-1]):
+            listener.path(node)
+    return path
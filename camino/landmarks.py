@@ -0,0 +1,172 @@
+from heapq import heappop, heappush
+
+import numpy as np
+
+from .field import distance_field
+from .grid import DIRECTIONS, SQRT2
+from .search import float32_below, heuristic_function, heuristic_table
+
+
+# Heurística ALT (A*, landmarks y desigualdad triangular) para muchas consultas
+# sobre un mismo mapa. Se eligen count celdas de referencia (landmarks) lo más
+# alejadas posible entre sí y se guarda la distancia de cada una a todo el mapa.
+# Para cualquier par de celdas, |d(L, t) - d(L, v)| es una cota inferior de
+# d(v, t); function(goal) y table(goal) toman la mejor de esas cotas (y de la
+# octil) para cada celda. Se pasa a astar como metric: astar(grid, s, t, metric=landmarks).
+#
+# Las distancias son las de un mapa "de referencia" (cells) que puede tener
+# menos obstáculos que el actual: con más obstáculos las distancias reales sólo
+# crecen, así que la cota sigue siendo admisible y consistente, aunque más
+# floja. Por eso, tras editar el mapa, una celda que pasa a ser obstáculo no
+# exige recalcular nada, y una que se libera se incorpora propagando desde ella
+# las distancias que bajan. rebuild() vuelve a empezar con el mapa actual.
+class Landmarks:
+    def __init__(self, grid, count=8, directions=DIRECTIONS, diagonal=SQRT2, seed=0):
+        self.grid = grid
+        self.count = count
+        self.directions = tuple(directions)
+        self.diagonal = diagonal
+        self.seed = seed
+        self.rebuild()
+
+    def rebuild(self):
+        grid = self.grid
+        self.version = grid.version
+        self._last = None  # (objetivo y versión, tabla) de la última consulta
+        self.cells = np.array(grid.cells, dtype=np.uint8)
+        self.nodes = []
+        self.dist = np.empty((0, grid.size))
+        free = np.flatnonzero(self.cells == 0)
+        if free.size == 0:
+            return
+
+        # Selección por el punto más lejano: cada landmark es la celda libre más
+        # alejada de las anteriores (o de otra región, si quedan sin alcanzar)
+        rng = np.random.default_rng(self.seed)
+        node = int(free[rng.integers(free.size)])
+        nearest = np.full(grid.size, np.inf)
+        rows = []
+        for _ in range(min(self.count, free.size)):
+            dist = distance_field(grid, node, self.directions, self.diagonal)[0]
+            self.nodes.append(node)
+            rows.append(dist)
+            nearest = np.minimum(nearest, dist)
+            candidates = nearest[free]
+            candidates[np.isin(free, self.nodes)] = -1
+            node = int(free[np.argmax(candidates)])
+        self.dist = np.array(rows)
+
+    def table(self, goal):
+        # Cota inferior de la distancia de cada celda a goal, en float32 como
+        # heuristic_table
+        metric = "octile" if any(dr and dc for dr, dc in self.directions) else "manhattan"
+        return np.maximum(heuristic_table(self.grid, goal, metric, self.diagonal), self._bounds(goal))
+
+    def function(self, goal):
+        # La misma cota como función de un nodo (heuristic_function): la parte
+        # geométrica se calcula exacta y sólo la de los landmarks sale de la
+        # tabla en float32, así los empates entre caminos de igual costo no se
+        # rompen por el redondeo
+        metric = "octile" if any(dr and dc for dr, dc in self.directions) else "manhattan"
+        geometric = heuristic_function(self.grid, goal, metric, self.diagonal)
+        bounds = self._bounds(goal).item
+
+        def h(node):
+            return max(geometric(node), bounds(node))
+        return h
+
+    def _bounds(self, goal):
+        # Mejor cota de los landmarks hacia goal, acumulada fila a fila para no
+        # crear un arreglo de count x celdas. Se guarda la última, para
+        # consultas seguidas hacia el mismo objetivo.
+        self._sync()
+        key = (goal, self.grid.version)
+        if self._last is not None and self._last[0] == key:
+            return self._last[1]
+        alt = np.zeros(self.grid.size)
+        to_goal = self.dist[:, goal]
+        usable = np.isfinite(to_goal)
+        for dist, distance in zip(self.dist[usable], to_goal[usable]):
+            np.maximum(alt, np.abs(dist - distance), out=alt)
+        bounds = float32_below(alt)
+        self._last = (key, bounds)
+        return bounds
+
+    def clear(self):
+        # Descarta la tabla guardada de la última consulta
+        self._last = None
+
+    def admissible(self, directions, diagonal):
+        # Las cotas valen con los mismos costos y un subconjunto de los
+        # movimientos con que se calcularon las distancias
+        return set(directions) <= set(self.directions) and diagonal == self.diagonal
+
+    def _sync(self):
+        grid = self.grid
+        changes = grid.changes_since(self.version)
+        if changes is None:
+            # Cambio masivo: se compara el mapa entero con el de referencia
+            changes = np.flatnonzero(self.cells & (grid.cells == 0)).tolist()
+        self.version = grid.version
+        freed = [node for node in changes if self.cells[node] and not grid.cells[node]]
+        if freed:
+            self._release(freed)
+
+    def _release(self, nodes):
+        # Libera nodes en el mapa de referencia y propaga en cada landmark las
+        # distancias que bajan (Dijkstra desde las celdas liberadas)
+        grid = self.grid
+        rows, cols = grid.rows, grid.cols
+        cells = self.cells
+        steps = [(dr, dc, 1 if dr == 0 or dc == 0 else self.diagonal) for dr, dc in self.directions]
+        cells[nodes] = 0
+
+        def neighbors(node):
+            row, col = divmod(node, cols)
+            for dr, dc, cost in steps:
+                r, c = row + dr, col + dc
+                if 0 <= r < rows and 0 <= c < cols and not cells[r * cols + c]:
+                    yield r * cols + c, cost
+
+        for dist in self.dist:
+            open_set = []
+            for node in nodes:
+                best = min((dist[n] + cost for n, cost in neighbors(node)), default=np.inf)
+                if best < dist[node]:
+                    dist[node] = best
+                    heappush(open_set, (best, node))
+            while open_set:
+                current_distance, current = heappop(open_set)
+                if current_distance > dist[current]:
+                    continue  # Entrada obsoleta
+                for neighbor, cost in neighbors(current):
+                    if current_distance + cost < dist[neighbor]:
+                        dist[neighbor] = current_distance + cost
+                        heappush(open_set, (current_distance + cost, neighbor))
+
+    def save(self, path):
+        # Guarda las tablas (formato .npz de NumPy) junto al mapa
+        self._sync()
+        np.savez(path, nodes=np.array(self.nodes, dtype=np.int64), dist=self.dist, cells=self.cells,
+                 directions=np.array(self.directions, dtype=np.int64), diagonal=self.diagonal,
+                 seed=self.seed)
+
+    @classmethod
+    def load(cls, path, grid):
+        # Carga tablas guardadas con save para grid; si el mapa cambió desde
+        # entonces, las celdas liberadas se incorporan en la primera consulta
+        with np.load(path) as data:
+            if data["cells"].size != grid.size:
+                raise ValueError(f"{path}: las tablas son de un mapa de otro tamaño")
+            landmarks = cls.__new__(cls)
+            landmarks.grid = grid
+            landmarks.nodes = data["nodes"].tolist()
+            landmarks.count = len(landmarks.nodes)
+            landmarks.dist = data["dist"]
+            landmarks.cells = data["cells"]
+            landmarks.directions = tuple(map(tuple, data["directions"].tolist()))
+            landmarks.diagonal = float(data["diagonal"])
+            landmarks.seed = int(data["seed"])
+        landmarks.version = -1  # Obliga a comparar con el mapa actual
+        landmarks._last = None
+        return landmarks
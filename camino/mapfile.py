@@ -0,0 +1,120 @@
+import os
+import struct
+
+import numpy as np
+
+from .grid import Grid
+
+# Formato binario de mapas (.cmap). Cabecera de 16 bytes en little endian:
+#   magic b"CMAP", versión del formato (u8), capa (u8: 0 = un byte por celda,
+#   1 = un bit por celda), banderas (u16), filas (u32), columnas (u32)
+# seguida de la capa de obstáculos en orden fila por fila. Con capa de bytes
+# puede ir a continuación la máscara de vecinos (bandera HAS_MASK), de modo que
+# load_map abre el mapa con mmap sin leerlo ni recalcular nada.
+MAGIC = b"CMAP"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBBHII")
+LAYER_BYTES, LAYER_BITS = 0, 1
+HAS_MASK = 1
+
+# Terreno transitable en los mapas de benchmark (.map): suelo, suelo y pantano.
+# El resto (árboles, agua, fuera del mapa) se toma como obstáculo.
+BENCHMARK_PASSABLE = b".GS"
+
+
+# Guarda grid en path. packed usa un bit por celda (8 veces más pequeño, pero
+# al cargarlo hay que desempaquetarlo); si no, se guarda un byte por celda y la
+# máscara de vecinos, listos para mmap.
+def save_map(grid, path, packed=False):
+    with open(path, "wb") as f:
+        if packed:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, LAYER_BITS, 0, grid.rows, grid.cols))
+            f.write(np.packbits(grid.cells != 0).tobytes())
+        else:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, LAYER_BYTES, HAS_MASK, grid.rows, grid.cols))
+            f.write(np.ascontiguousarray(grid.cells, dtype=np.uint8).tobytes())
+            f.write(np.ascontiguousarray(grid.mask, dtype=np.uint8).tobytes())
+
+
+# Abre un mapa .cmap. Con mmap la capa de bytes y la máscara se usan
+# directamente desde el archivo; mode es el de np.memmap: "c" (por defecto)
+# permite editar el mapa en memoria sin tocar el archivo, "r+" escribe los
+# cambios en el archivo y "r" lo deja de sólo lectura.
+def load_map(path, mmap=True, mode="c"):
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError(f"{path}: archivo demasiado corto para ser un mapa")
+    magic, version, layer, flags, rows, cols = HEADER.unpack(header)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"{path}: no es un mapa .cmap compatible")
+    size = rows * cols
+
+    if layer == LAYER_BITS:
+        count = (size + 7) // 8
+    elif layer == LAYER_BYTES:
+        count = 2 * size if flags & HAS_MASK else size
+    else:
+        raise ValueError(f"{path}: capa de obstáculos desconocida ({layer})")
+    if os.path.getsize(path) != HEADER.size + count:
+        raise ValueError(f"{path}: el tamaño del archivo no coincide con la cabecera ({rows}x{cols})")
+
+    if layer == LAYER_BITS:
+        data = np.fromfile(path, dtype=np.uint8, count=count, offset=HEADER.size)
+        return Grid(rows, cols, np.unpackbits(data, count=size))
+    if mmap:
+        data = np.memmap(path, dtype=np.uint8, mode=mode, offset=HEADER.size, shape=(count,))
+    else:
+        data = np.fromfile(path, dtype=np.uint8, count=count, offset=HEADER.size)
+    if flags & HAS_MASK:
+        return Grid(rows, cols, data[:size], data[size:])
+    return Grid(rows, cols, data)
+
+
+# Importa un mapa de benchmark en formato .map ("type octile", "height",
+# "width", "map" y las filas de caracteres)
+def load_benchmark_map(path):
+    with open(path, "rb") as f:
+        header = {}
+        for line in f:
+            line = line.strip()
+            if line == b"map":
+                break
+            key, _, value = line.partition(b" ")
+            header[key] = value
+        rows, cols = int(header[b"height"]), int(header[b"width"])
+        lines = [f.readline().rstrip(b"\r\n") for _ in range(rows)]
+    if any(len(line) != cols for line in lines):
+        raise ValueError(f"{path}: las filas no coinciden con height/width")
+    chars = np.frombuffer(b"".join(lines), dtype=np.uint8)
+    passable = np.isin(chars, np.frombuffer(BENCHMARK_PASSABLE, dtype=np.uint8))
+    return Grid(rows, cols, (~passable).astype(np.uint8))
+
+
+# Importa una máscara de texto, una fila por línea ('#' = obstáculo)
+def load_text_map(path, wall="#"):
+    with open(path, encoding="utf-8") as f:
+        return Grid.from_rows(f.read().splitlines(), wall)
+
+
+# Importa una imagen (PNG u otro formato que lea pygame): los píxeles más
+# oscuros que threshold son obstáculos. Es la única función que necesita pygame.
+def load_image_map(path, threshold=128):
+    import pygame
+
+    rgb = pygame.surfarray.array3d(pygame.image.load(path)).swapaxes(0, 1)
+    luminance = rgb @ np.array([0.299, 0.587, 0.114])
+    rows, cols = luminance.shape
+    return Grid(rows, cols, (luminance < threshold).astype(np.uint8).reshape(rows * cols))
+
+
+# Abre cualquiera de los formatos anteriores según la extensión
+def open_map(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".map":
+        return load_benchmark_map(path)
+    if ext == ".txt":
+        return load_text_map(path)
+    if ext in (".png", ".bmp", ".gif", ".jpg", ".jpeg", ".tga"):
+        return load_image_map(path)
+    return load_map(path)
@@ -0,0 +1,25 @@
+import cProfile
+import pstats
+
+from .grid import DIRECTIONS
+
+# Ayudas para perfilar las búsquedas. Los contadores de SearchResult.stats dicen
+# cuánto trabajo hizo el algoritmo; cProfile dice en qué funciones se fue el
+# tiempo (heapq, heurística, receptor...). Para un perfilador por muestreo como
+# py-spy basta con lanzarlo sobre el proceso, por ejemplo:
+#   py-spy record -o perfil.svg -- python -m camino.bench --sizes 200
+
+
+# Ejecuta una búsqueda bajo cProfile. Devuelve el SearchResult y el
+# pstats.Stats ordenado por sort; si limit no es None imprime esas filas.
+# Con path se guarda además el perfil en un archivo para snakeviz o pstats.
+def profile_search(solver, grid, start, end, listener=None, directions=DIRECTIONS,
+                   sort="tottime", limit=20, path=None):
+    profiler = cProfile.Profile()
+    result = profiler.runcall(solver, grid, start, end, listener, directions)
+    if path is not None:
+        profiler.dump_stats(path)
+    stats = pstats.Stats(profiler).sort_stats(sort)
+    if limit is not None:
+        stats.print_stats(limit)
+    return result, stats
@@ -0,0 +1,219 @@
+import math
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from .grid import SQRT2
+
+
+def heuristic(pos1, pos2):
+    x1, y1 = pos1
+    x2, y2 = pos2
+    return math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
+
+
+# Heurísticas para otros modelos de movimiento. octile es la distancia exacta
+# sin obstáculos con costos 1 y diagonal, y acota mejor que la euclídea con
+# diagonal √2; chebyshev es octile con diagonal 1 (script 4) y manhattan es la
+# distancia exacta con sólo 4 direcciones.
+def octile(pos1, pos2, diagonal=SQRT2):
+    dr, dc = abs(pos1[0] - pos2[0]), abs(pos1[1] - pos2[1])
+    return max(dr, dc) + (diagonal - 1) * min(dr, dc)
+
+
+def chebyshev(pos1, pos2):
+    return max(abs(pos1[0] - pos2[0]), abs(pos1[1] - pos2[1]))
+
+
+def manhattan(pos1, pos2):
+    return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+
+
+# Heurística hacia goal como función de un nodo, calculada en cada consulta a
+# partir de divmod igual que la euclídea de astar: no ocupa memoria ni hace
+# falta preparar nada por objetivo. Los valores son idénticos a los de las
+# funciones de arriba. metric también puede ser un objeto con sus propios
+# métodos function(goal) y table(goal), como Landmarks (heurística ALT).
+def heuristic_function(grid, goal, metric="octile", diagonal=SQRT2):
+    if not isinstance(metric, str):
+        return metric.function(goal)
+    cols = grid.cols
+    goal_row, goal_col = divmod(goal, cols)
+    if metric == "euclidean":
+        def h(node):
+            row, col = divmod(node, cols)
+            return math.sqrt((row - goal_row) ** 2 + (col - goal_col) ** 2)
+    elif metric == "octile":
+        extra = diagonal - 1
+
+        def h(node):
+            row, col = divmod(node, cols)
+            dr, dc = abs(row - goal_row), abs(col - goal_col)
+            return dr + extra * dc if dr > dc else dc + extra * dr
+    elif metric == "chebyshev":
+        def h(node):
+            row, col = divmod(node, cols)
+            return max(abs(row - goal_row), abs(col - goal_col))
+    elif metric == "manhattan":
+        def h(node):
+            row, col = divmod(node, cols)
+            return abs(row - goal_row) + abs(col - goal_col)
+    else:
+        raise ValueError(f"Heurística desconocida: {metric}")
+    return h
+
+
+# Heurística hacia goal de todas las celdas, calculada de una vez con NumPy,
+# para pasarla a astar como estimates cuando se van a hacer muchas consultas
+# hacia el mismo objetivo. Ocupa 4 bytes por celda porque se guarda en float32,
+# redondeando hacia abajo para que siga siendo una cota inferior; ese redondeo
+# deshace los empates exactos entre caminos de igual costo, así que con
+# octile y euclidean A* puede expandir más nodos que calculándola.
+def heuristic_table(grid, goal, metric="octile", diagonal=SQRT2):
+    if not isinstance(metric, str):
+        return metric.table(goal)
+    goal_row, goal_col = divmod(goal, grid.cols)
+    rows, cols = np.indices((grid.rows, grid.cols))
+    dr = np.abs(rows - goal_row).ravel()
+    dc = np.abs(cols - goal_col).ravel()
+    if metric == "euclidean":
+        table = np.sqrt(dr * dr + dc * dc)
+    elif metric == "octile":
+        table = np.maximum(dr, dc) + (diagonal - 1) * np.minimum(dr, dc)
+    elif metric == "chebyshev":
+        table = np.maximum(dr, dc)
+    elif metric == "manhattan":
+        table = dr + dc
+    else:
+        raise ValueError(f"Heurística desconocida: {metric}")
+    return float32_below(table)
+
+
+# Convierte values a float32 sin que ningún valor quede por encima del original
+def float32_below(values):
+    values = np.asarray(values, dtype=np.float64)
+    table = values.astype(np.float32)
+    above = table > values
+    table[above] = np.nextafter(table[above], np.float32(-np.inf))
+    return table
+
+
+# True si metric nunca sobreestima el costo real con esas direcciones y ese
+# costo diagonal, que es lo que hace falta para que las cotas de
+# SearchResult.bound valgan. None es la euclídea de astar. Los objetos (como
+# Landmarks) lo deciden con su método admissible(directions, diagonal).
+def admissible(metric, directions, diagonal):
+    if metric is not None and not isinstance(metric, str):
+        return metric.admissible(directions, diagonal)
+    moves_diagonally = any(dr and dc for dr, dc in directions)
+    if metric is None or metric == "euclidean":
+        return not moves_diagonally or diagonal >= SQRT2
+    if metric == "octile":
+        return 1 <= diagonal <= 2
+    if metric == "chebyshev":
+        return not moves_diagonally or diagonal >= 1
+    if metric == "manhattan":
+        return not moves_diagonally
+    return False
+
+
+# Receptor de eventos de la búsqueda. Las interfaces gráficas lo extienden para
+# colorear celdas y redibujar; sin receptor los algoritmos no dibujan nada.
+class SearchListener:
+    def opened(self, pos):
+        pass
+
+    def closed(self, pos):
+        pass
+
+    def step(self):
+        pass
+
+    def path(self, pos):
+        pass
+
+
+# Envuelve a otro receptor y acumula en elapsed el tiempo pasado dentro de él,
+# que en la interfaz gráfica es el tiempo de dibujo
+class TimedListener(SearchListener):
+    def __init__(self, listener):
+        self.listener = listener
+        self.elapsed = 0
+
+    def opened(self, pos):
+        t = time.perf_counter()
+        self.listener.opened(pos)
+        self.elapsed += time.perf_counter() - t
+
+    def closed(self, pos):
+        t = time.perf_counter()
+        self.listener.closed(pos)
+        self.elapsed += time.perf_counter() - t
+
+    def step(self):
+        t = time.perf_counter()
+        self.listener.step()
+        self.elapsed += time.perf_counter() - t
+
+    def path(self, pos):
+        t = time.perf_counter()
+        self.listener.path(pos)
+        self.elapsed += time.perf_counter() - t
+
+
+def timed(listener):
+    return None if listener is None else TimedListener(listener)
+
+
+# Contadores de una búsqueda. pushed cuenta todas las inserciones en la lista
+# abierta (también las que mejoran un nodo ya abierto), stale las entradas
+# obsoletas descartadas y heuristic las evaluaciones de la heurística. El
+# tiempo total se reparte entre búsqueda y receptor (render_time).
+@dataclass
+class SearchStats:
+    expanded: int = 0
+    pushed: int = 0
+    stale: int = 0
+    heuristic: int = 0
+    search_time: float = 0
+    render_time: float = 0
+
+
+def search_stats(elapsed, listener, expanded, pushed, stale=0, heuristic=0):
+    # listener es el TimedListener de la búsqueda (o None)
+    render_time = listener.elapsed if listener is not None else 0
+    return SearchStats(expanded, pushed, stale, heuristic, elapsed - render_time, render_time)
+
+
+@dataclass
+class SearchResult:
+    path: list = None
+    cost: float = 0
+    analyzed: int = 0
+    elapsed: float = 0
+    expanded: int = 0
+    stats: SearchStats = None
+    # Cota demostrada de suboptimalidad (cost <= bound * óptimo) en las búsquedas
+    # que la conocen, como A* ponderado o ARA*; None si no se sabe
+    bound: float = None
+
+    @property
+    def found(self):
+        return self.path is not None
+
+    @property
+    def path_length(self):
+        # Número de movimientos del camino (celdas recorridas sin contar el inicio)
+        return len(self.path) - 1 if self.path else 0
+
+
+def reconstruct_path(came_from, current, listener=None):
+    path = [current]
+    while came_from.get(current) is not None:
+        current = came_from[current]
+        path.append(current)
+        if listener is not None:
+            listener.path(current)
+    path.reverse()
+    return path
@@ -0,0 +1,300 @@
+import math
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from .grid import DIRECTIONS, Grid
+from .mapfile import load_map, save_map
+from .search import SearchListener
+
+# Estados de cada celda
+EMPTY, START, END, OBSTACLE, PATH, CLOSED, OPEN = 0, 1, 2, 3, 4, 5, 6
+
+
+def draw_lines(win, rows, width, color):
+    gap = width // rows
+    for i in range(rows):
+        pygame.draw.line(win, color, (0, i * gap), (width, i * gap))
+        pygame.draw.line(win, color, (i * gap, 0), (i * gap, width))
+
+
+# Dibuja la cuadrícula repintando sólo las celdas cuyo estado cambió desde el
+# último cuadro. Las líneas están en una capa transparente que se precalcula
+# una vez y se copia encima de cada celda repintada.
+class GridRenderer:
+    def __init__(self, win, rows, width, palette, line_color):
+        self.win = win
+        self.rows = rows
+        self.width = width
+        self.gap = width // rows
+        self.palette = palette
+        self.lines = pygame.Surface((width, width), pygame.SRCALPHA)
+        draw_lines(self.lines, rows, width, line_color)
+        self.shown = None
+
+    def invalidate(self):
+        self.shown = None
+
+    def render(self, state):
+        if self.shown is None:
+            self.win.fill(self.palette[EMPTY])
+            changed = np.flatnonzero(state != EMPTY)
+        else:
+            changed = np.flatnonzero(state != self.shown)
+            if not changed.size:
+                return
+        gap = self.gap
+        rects = []
+        for node in changed.tolist():
+            row, col = divmod(node, self.rows)
+            rect = pygame.Rect(row * gap, col * gap, gap, gap)
+            self.win.fill(self.palette[state[node]], rect)
+            self.win.blit(self.lines, rect, rect)
+            rects.append(rect)
+        if self.shown is None:
+            self.win.blit(self.lines, (0, 0))
+            self.shown = state.copy()
+            pygame.display.update()
+        else:
+            self.shown[changed] = state[changed]
+            pygame.display.update(rects)
+
+    def cell_at(self, pos):
+        return get_clicked_pos(pos, self.rows, self.width)
+
+    def handle_event(self, event):
+        pass
+
+
+# Dibuja mapas grandes de un solo golpe: el estado visible se copia como
+# arreglo de píxeles a una superficie de 8 bits cuya paleta es la de la
+# cuadrícula, y se escala por vecino más cercano. La rueda del ratón acerca o aleja alrededor del cursor y las
+# flechas o el botón central desplazan la vista.
+class PixelRenderer:
+    MAX_SCALE = 64  # Píxeles por celda con el máximo acercamiento
+
+    def __init__(self, win, rows, width, palette):
+        self.win = win
+        self.rows = rows
+        self.width = width
+        self.background = palette[EMPTY]
+        self.colors = [tuple(palette.get(value, (0, 0, 0))) for value in range(256)]
+        self.surface = None
+        self.min_scale = width / rows
+        self.scale = self.min_scale
+        self.x0 = self.y0 = 0  # Celda en la esquina superior izquierda de la vista
+        self.shown = None
+
+    def invalidate(self):
+        self.shown = None
+
+    def visible(self):
+        # Número de celdas que caben en la ventana con la escala actual
+        return min(self.rows, math.ceil(self.width / self.scale))
+
+    def clamp(self):
+        limit = self.rows - self.visible()
+        self.x0 = max(0, min(self.x0, limit))
+        self.y0 = max(0, min(self.y0, limit))
+
+    def render(self, state):
+        if self.shown is not None and np.array_equal(state, self.shown):
+            return
+        count = self.visible()
+        view = state.reshape(self.rows, self.rows)[self.x0:self.x0 + count, self.y0:self.y0 + count]
+        if self.surface is None or self.surface.get_width() != count:
+            self.surface = pygame.Surface((count, count), depth=8)
+            self.surface.set_palette(self.colors)
+        pygame.surfarray.blit_array(self.surface, view)
+        size = round(count * self.scale)
+        self.win.fill(self.background)
+        self.win.blit(pygame.transform.scale(self.surface, (size, size)), (0, 0))
+        pygame.display.update()
+        self.shown = state.copy()
+
+    def cell_at(self, pos):
+        row = self.x0 + int(pos[0] / self.scale)
+        col = self.y0 + int(pos[1] / self.scale)
+        if 0 <= row < self.rows and 0 <= col < self.rows:
+            return row, col
+        return None
+
+    def zoom(self, factor, pos):
+        # Mantiene bajo el cursor la misma celda después de cambiar la escala
+        x = self.x0 + pos[0] / self.scale
+        y = self.y0 + pos[1] / self.scale
+        self.scale = max(self.min_scale, min(self.MAX_SCALE, self.scale * factor))
+        self.x0 = int(x - pos[0] / self.scale)
+        self.y0 = int(y - pos[1] / self.scale)
+        self.clamp()
+        self.invalidate()
+
+    def pan(self, dx, dy):
+        self.x0 += dx
+        self.y0 += dy
+        self.clamp()
+        self.invalidate()
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEWHEEL:
+            self.zoom(1.25 ** event.y, pygame.mouse.get_pos())
+        elif event.type == pygame.MOUSEMOTION and event.buttons[1]:
+            self.pan(-round(event.rel[0] / self.scale), -round(event.rel[1] / self.scale))
+        elif event.type == pygame.KEYDOWN:
+            step = max(1, self.visible() // 10)
+            moves = {pygame.K_LEFT: (-step, 0), pygame.K_RIGHT: (step, 0),
+                     pygame.K_UP: (0, -step), pygame.K_DOWN: (0, step)}
+            if event.key in moves:
+                self.pan(*moves[event.key])
+
+
+def get_clicked_pos(pos, rows, width):
+    gap = width // rows
+    y, x = pos
+    return y // gap, x // gap
+
+
+def handle_quit():
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+
+
+# Colorea las celdas a medida que avanza la búsqueda. Redibuja cada `every`
+# expansiones o, si se da `interval_ms`, como mucho una vez cada tantos
+# milisegundos; con ambos en None la búsqueda corre sin dibujar y sólo se ve
+# el resultado final.
+class Visualizer(SearchListener):
+    def __init__(self, state, start, end, draw, every=1, interval_ms=None):
+        self.state = state
+        self.start = start
+        self.end = end
+        self.draw = draw
+        self.every = every
+        self.interval = None if interval_ms is None else interval_ms / 1000
+        self.steps = 0
+        self.last_draw = time.perf_counter()
+
+    def mark(self, node, state):
+        if node != self.start and node != self.end:
+            self.state[node] = state
+
+    def opened(self, node):
+        self.mark(node, OPEN)
+
+    def closed(self, node):
+        self.mark(node, CLOSED)
+
+    def step(self):
+        self.steps += 1
+        if self.interval is not None:
+            now = time.perf_counter()
+            if now - self.last_draw < self.interval:
+                return
+            self.last_draw = now
+        elif not self.every or self.steps % self.every:
+            return
+        handle_quit()
+        self.draw()
+
+    def path(self, node):
+        self.mark(node, PATH)
+
+
+# Bucle principal del editor: clic izquierdo coloca inicio, fin y obstáculos,
+# clic derecho borra, ESPACIO busca animando según redraw_every/redraw_ms,
+# ENTER busca sin animación y C limpia la cuadrícula. S guarda los obstáculos
+# en map_path y L los vuelve a cargar. Con pixel=None se usa PixelRenderer
+# cuando las celdas medirían menos de 4 píxeles.
+def run(solver, caption, palette, line_color, report, width=800, rows=50,
+        directions=DIRECTIONS, fps=60, redraw_every=1, redraw_ms=None, pixel=None,
+        map_path="mapa.cmap"):
+    pygame.init()
+    win = pygame.display.set_mode((width, width))
+    pygame.display.set_caption(caption)
+    clock = pygame.time.Clock()
+
+    grid = Grid(rows)
+    state = np.zeros(grid.size, dtype=np.uint8)
+    start, end = None, None
+
+    if pixel is None:
+        pixel = width // rows < 4
+    if pixel:
+        renderer = PixelRenderer(win, rows, width, palette)
+    else:
+        renderer = GridRenderer(win, rows, width, palette, line_color)
+
+    def redraw():
+        renderer.render(state)
+
+    running = True
+    while running:
+        redraw()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                renderer.invalidate()
+            renderer.handle_event(event)
+
+            pos = renderer.cell_at(pygame.mouse.get_pos())
+            if pos is not None and pygame.mouse.get_pressed()[0]:  # Izquierdo
+                node = grid.index(pos)
+                if start is None and node != end:
+                    start = node
+                    state[node] = START
+                    grid.reset(node)
+                elif end is None and node != start:
+                    end = node
+                    state[node] = END
+                    grid.reset(node)
+                elif node != end and node != start:
+                    state[node] = OBSTACLE
+                    grid.make_obstacle(node)
+
+            elif pos is not None and pygame.mouse.get_pressed()[2]:  # Derecho
+                node = grid.index(pos)
+                state[node] = EMPTY
+                grid.reset(node)
+                if node == start:
+                    start = None
+                elif node == end:
+                    end = None
+
+            if event.type == pygame.KEYDOWN:
+                if event.key in (pygame.K_SPACE, pygame.K_RETURN) and start is not None and end is not None:
+                    if event.key == pygame.K_SPACE:
+                        listener = Visualizer(state, start, end, redraw, redraw_every, redraw_ms)
+                    else:
+                        listener = Visualizer(state, start, end, redraw, None)
+                    report(solver(grid, start, end, listener, directions))
+
+                if event.key == pygame.K_c:
+                    start, end = None, None
+                    grid.clear()
+                    state[:] = EMPTY
+
+                if event.key == pygame.K_s:
+                    save_map(grid, map_path)
+                    print(f"Mapa guardado en {map_path}")
+
+                if event.key == pygame.K_l:
+                    try:
+                        loaded = load_map(map_path, mmap=False)
+                    except (OSError, ValueError) as error:
+                        print(f"No se pudo cargar el mapa: {error}")
+                    else:
+                        if (loaded.rows, loaded.cols) != (grid.rows, grid.cols):
+                            print(f"El mapa de {map_path} es de {loaded.rows}x{loaded.cols}, no de {rows}x{rows}")
+                        else:
+                            start, end = None, None
+                            grid = loaded
+                            state[:] = np.where(grid.cells != 0, OBSTACLE, EMPTY)
+
+        clock.tick(fps)  # Limitar la velocidad de cuadros por segundo
+
+    pygame.quit()
@@ -0,0 +1,22 @@
+import numpy as np
+
+from camino.grid import SQRT2, Grid
+
+
+# Utilidades comunes de las pruebas (pytest pone esta carpeta en sys.path)
+
+# Mapa aleatorio con una proporción density de obstáculos
+def random_grid(rng, rows, cols=None, density=0.3):
+    cols = rows if cols is None else cols
+    return Grid(rows, cols, (rng.random(rows * cols) < density).astype(np.uint8))
+
+
+# Costo de un camino comprobando que cada paso es entre celdas libres vecinas
+def path_cost(grid, path, diagonal=SQRT2):
+    cost = 0
+    for a, b in zip(path, path[1:]):
+        (ra, ca), (rb, cb) = grid.pos(a), grid.pos(b)
+        assert not grid.cells[a] and not grid.cells[b]
+        assert max(abs(ra - rb), abs(ca - cb)) == 1
+        cost += 1 if ra == rb or ca == cb else diagonal
+    return cost
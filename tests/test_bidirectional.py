@@ -0,0 +1,41 @@
+import math
+
+import numpy as np
+
+from camino import bidirectional_astar, bidirectional_dijkstra, distance_field
+from camino.grid import DIRECTIONS, DIRECTIONS_ALT, SQRT2
+
+from helpers import path_cost, random_grid
+
+
+def check(solver, diagonal, directions):
+    for seed in range(40):
+        rng = np.random.default_rng(seed)
+        grid = random_grid(rng, 30, density=(0.1, 0.25, 0.4)[seed % 3])
+        free = np.flatnonzero(grid.cells == 0)
+        for _ in range(5):
+            start, end = (int(node) for node in rng.choice(free, 2, replace=False))
+            result = solver(grid, start, end, None, directions)
+            best = distance_field(grid, end, directions, diagonal)[0][start]
+            if math.isinf(best):
+                assert not result.found
+                continue
+            assert result.found and math.isclose(result.cost, best)
+            assert result.path[0] == start and result.path[-1] == end
+            assert math.isclose(path_cost(grid, result.path, diagonal), best)
+
+
+def test_bidirectional_astar_is_optimal():
+    check(bidirectional_astar, SQRT2, DIRECTIONS)
+    check(bidirectional_astar, SQRT2, DIRECTIONS_ALT)
+
+
+def test_bidirectional_dijkstra_is_optimal():
+    check(bidirectional_dijkstra, 1, DIRECTIONS)
+    check(bidirectional_dijkstra, 1, DIRECTIONS_ALT)
+
+
+def test_straight_directions_only():
+    # Sin diagonales el camino sólo puede dar pasos en recta
+    check(bidirectional_astar, SQRT2, DIRECTIONS[:4])
+    check(bidirectional_dijkstra, 1, DIRECTIONS[:4])
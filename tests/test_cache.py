@@ -0,0 +1,107 @@
+import math
+
+import numpy as np
+import pytest
+
+from camino import Grid, PathCache, astar, dijkstra, distance_field
+from camino.grid import DIRECTIONS, DIRECTIONS_ALT, SQRT2
+
+from helpers import path_cost, random_grid
+
+
+@pytest.mark.parametrize("solver, directions, diagonal", [
+    (astar, DIRECTIONS, SQRT2),  # Script 2
+    (dijkstra, DIRECTIONS_ALT, 1),  # Script 4
+])
+def test_costs_match_distance_field(solver, directions, diagonal):
+    for seed in range(10):
+        rng = np.random.default_rng(seed)
+        grid = random_grid(rng, 25, density=0.25)
+        cache = PathCache(solver, diagonal=diagonal)
+        free = np.flatnonzero(grid.cells == 0)
+        queries = [tuple(int(node) for node in rng.choice(free, 2, replace=False)) for _ in range(30)]
+        # Tramos de los caminos ya guardados, en los dos sentidos
+        for start, end in queries[:10]:
+            path = cache(grid, start, end, None, directions).path
+            if path is not None and len(path) > 2:
+                i, j = sorted(rng.choice(len(path), 2, replace=False).tolist())
+                queries += [(path[i], path[j]), (path[j], path[i])]
+        for start, end in queries + queries:
+            result = cache(grid, start, end, None, directions)
+            best = distance_field(grid, end, directions, diagonal)[0][start]
+            if not math.isfinite(best):
+                assert not result.found
+                continue
+            assert result.path[0] == start and result.path[-1] == end
+            assert math.isclose(result.cost, best)
+            assert math.isclose(path_cost(grid, result.path, diagonal), best)
+        assert cache.subpath_hits > 0
+
+
+def test_reversed_subpaths_use_the_accumulated_costs():
+    grid = Grid(10)
+    cache = PathCache()
+    path = cache(grid, 0, 99).path
+    assert path == list(range(0, 100, 11))
+
+    result = cache(grid, 55, 11)
+    assert result.path == [55, 44, 33, 22, 11]
+    assert math.isclose(result.cost, 4 * SQRT2)
+
+    # Camino con pasos rectos y diagonales: el tramo cuesta lo que sus pasos
+    cache(grid, 0, 39)
+    for start, end in [(39, 1), (3, 0), (1, 38)]:
+        result = cache(grid, start, end)
+        assert result.path[0] == start and result.path[-1] == end
+        assert math.isclose(result.cost, path_cost(grid, result.path))
+        assert math.isclose(result.cost, distance_field(grid, end, diagonal=SQRT2)[0][start])
+    assert cache.subpath_hits == 4 and cache.misses == 2
+
+
+def test_eviction_drops_the_least_recently_used_path():
+    grid = Grid(10)
+    cache = PathCache(maxsize=2)
+    rows = [(0, 9), (20, 29), (40, 49)]
+    cache(grid, *rows[0])
+    cache(grid, *rows[1])
+    cache(grid, *rows[0])  # Ahora la menos usada es la segunda
+    cache(grid, *rows[2])
+    assert list(cache.entries) == [rows[0], rows[2]]
+    # El índice de nodos sólo conserva los de los caminos guardados
+    assert set(cache.through) == set(range(0, 10)) | set(range(40, 50))
+    assert all(rows[1] not in keys for keys in cache.through.values())
+    assert cache(grid, 22, 27).path is not None and cache.subpath_hits == 0
+
+
+def test_edits_invalidate_the_cache():
+    grid = Grid(10)
+    cache = PathCache()
+    assert cache(grid, 0, 9).path == list(range(10))
+    grid.make_obstacle(5)
+    result = cache(grid, 0, 9)
+    assert 5 not in result.path
+    assert math.isclose(result.cost, 7 + 2 * SQRT2)
+    assert cache.hits == 0 and cache.misses == 2
+
+    cache(grid, 0, 9)
+    grid.reset(5)
+    assert cache(grid, 0, 9).path == list(range(10))
+    assert cache.hits == 1 and cache.misses == 3
+
+
+def test_counters():
+    grid = Grid(10)
+    cache = PathCache()
+    assert cache.hit_rate == 0.0
+    cache(grid, 0, 99)  # Fallo
+    cache(grid, 0, 99)  # Acierto
+    cache(grid, 11, 88)  # Tramo
+    cache(grid, 88, 11)  # Tramo
+    assert (cache.hits, cache.subpath_hits, cache.misses) == (1, 2, 1)
+    assert cache.hit_rate == 0.75
+
+    plain = PathCache(subpaths=False)
+    plain(grid, 0, 99)
+    plain(grid, 11, 88)
+    assert (plain.hits, plain.subpath_hits, plain.misses) == (0, 0, 2)
+    assert plain.through == {}
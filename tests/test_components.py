@@ -0,0 +1,94 @@
+import numpy as np
+
+from camino import Components, Grid, astar, distance_field, solve_batch, solve_batch_parallel
+
+from helpers import random_grid
+
+
+def check_regions(grid):
+    # Las regiones coinciden con lo que alcanza distance_field desde cada una
+    components = grid.components
+    expected = np.zeros(grid.size, dtype=np.int64)
+    for node in np.flatnonzero(grid.cells == 0).tolist():
+        if not expected[node]:
+            expected[np.isfinite(distance_field(grid, node)[0])] = node + 1
+    regions = [components.region(node) for node in range(grid.size)]
+    pairs = set(zip(regions, expected.tolist()))
+    assert all((region == 0) == (label == 0) for region, label in pairs)
+    assert len({region for region, _ in pairs}) == len({label for _, label in pairs}) == len(pairs)
+    free = np.flatnonzero(grid.cells == 0).tolist()
+    for start, end in zip(free, free[::-1]):
+        assert components.unreachable(start, end) == (expected[start] != expected[end])
+
+
+def test_labels_match_distance_field_on_random_grids():
+    for seed in range(40):
+        rng = np.random.default_rng(seed)
+        rows, cols = (int(n) for n in rng.integers(1, 30, 2))
+        grid = Grid(rows, cols, (rng.random(rows * cols) < rng.random()).astype(np.uint8))
+        check_regions(grid)
+
+
+def test_edit_sequences_split_and_merge_regions():
+    for seed in range(30):
+        rng = np.random.default_rng(seed)
+        grid = random_grid(rng, 20, density=(0.3, 0.4, 0.5)[seed % 3])
+        grid.build_components()
+        for _ in range(15):
+            for node in rng.choice(grid.size, 6).tolist():
+                if grid.cells[node]:
+                    grid.reset(node)
+                else:
+                    grid.make_obstacle(node)
+            check_regions(grid)
+
+
+def test_wall_splits_a_region_and_opening_it_merges_back():
+    grid = Grid(12)
+    components = grid.components
+    wall = [row * 12 + 6 for row in range(12)]
+    for node in wall[:-1]:
+        grid.make_obstacle(node)
+        assert not components.unreachable(0, 11)
+    grid.make_obstacle(wall[-1])
+    assert components.unreachable(0, 11)
+    grid.reset(wall[5])
+    assert not components.unreachable(0, 11)
+
+
+def test_bulk_changes_relabel():
+    rng = np.random.default_rng(1)
+    grid = random_grid(rng, 20, density=0.4)
+    grid.build_components()
+    grid.cells[:] = (rng.random(grid.size) < 0.45).astype(np.uint8)
+    grid.update_neighbors()
+    check_regions(grid)
+    grid.clear()
+    check_regions(grid)
+
+
+def test_resolved_labels_can_be_shared():
+    rng = np.random.default_rng(2)
+    grid = random_grid(rng, 30, density=0.4)
+    for node in rng.choice(grid.size, 40).tolist():
+        grid.make_obstacle(node)  # Deja uniones pendientes en el union-find
+    shared = Grid(grid.rows, grid.cols, grid.cells.copy(), grid.mask.copy(), grid.components.resolved())
+    assert isinstance(shared.components, Components)
+    check_regions(shared)
+
+
+def test_search_does_not_build_the_index():
+    grid = Grid(50)
+    grid.make_obstacle(1)
+    assert astar(grid, 0, 2).found
+    assert not grid.unreachable(0, 2)
+    assert grid._components is None
+
+
+def test_parallel_batch_matches_serial():
+    rng = np.random.default_rng(3)
+    grid = random_grid(rng, 40, density=0.42)
+    pairs = [tuple(int(node) for node in rng.choice(grid.size, 2, replace=False)) for _ in range(60)]
+    serial = solve_batch(grid, pairs)
+    parallel = solve_batch_parallel(grid, pairs, processes=2, chunksize=16)
+    assert [result.cost for result in parallel] == [result.cost for result in serial]
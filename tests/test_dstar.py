@@ -0,0 +1,64 @@
+import math
+
+import numpy as np
+import pytest
+
+from camino import DStarLite, SearchListener, distance_field
+from camino.grid import SQRT2
+
+from helpers import path_cost, random_grid
+
+
+class Counter(SearchListener):
+    def __init__(self):
+        self.opened_count = 0
+        self.closed_count = 0
+
+    def opened(self, pos):
+        self.opened_count += 1
+
+    def closed(self, pos):
+        self.closed_count += 1
+
+
+@pytest.mark.parametrize("diagonal", [SQRT2, 1])
+def test_replans_match_distance_field_after_edits(diagonal):
+    for seed in range(30):
+        rng = np.random.default_rng(seed)
+        grid = random_grid(rng, 24)
+        start, goal = (int(node) for node in rng.choice(grid.size, 2, replace=False))
+        grid.reset(start)
+        grid.reset(goal)
+        planner = DStarLite(diagonal)
+        for _ in range(6):
+            result = planner(grid, start, goal)
+            best = distance_field(grid, goal, diagonal=diagonal)[0][start]
+            if math.isinf(best):
+                assert not result.found
+            else:
+                assert result.found and math.isclose(result.cost, best)
+                assert result.path[0] == start and result.path[-1] == goal
+                assert math.isclose(path_cost(grid, result.path, diagonal), best)
+                if len(result.path) > 2:
+                    start = result.path[1]  # El agente avanza un paso
+            for node in rng.choice(grid.size, 15).tolist():
+                if node in (start, goal):
+                    continue
+                if grid.cells[node]:
+                    grid.reset(node)
+                else:
+                    grid.make_obstacle(node)
+
+
+def test_replan_after_bulk_edit_reports_opened_cells():
+    grid = random_grid(np.random.default_rng(0), 24)
+    grid.reset(0)
+    grid.reset(grid.size - 1)
+    planner = DStarLite()
+    planner(grid, 0, grid.size - 1)
+    grid.clear()
+    counter = Counter()
+    result = planner(grid, 0, grid.size - 1, counter)
+    assert result.found and math.isclose(result.cost, (grid.rows - 1) * SQRT2)
+    assert counter.opened_count > 0 and counter.closed_count > 0
+    assert result.analyzed == counter.opened_count
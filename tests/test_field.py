@@ -0,0 +1,58 @@
+from collections import deque
+
+import numpy as np
+
+from camino import DistanceField, wavefront
+from camino.grid import DIRECTIONS, DIRECTIONS_ALT
+
+from helpers import random_grid
+
+
+def reference(grid, goal, directions):
+    # Búsqueda en anchura celda a celda; flow apunta al vecino de menor índice
+    # entre los de la distancia anterior, como el Dijkstra de distance_field
+    dist = np.full(grid.size, np.inf)
+    flow = np.full(grid.size, -1, dtype=np.int32)
+    dist[goal] = 0
+    queue = deque([goal])
+    while queue:
+        current = queue.popleft()
+        row, col = grid.pos(current)
+        for dr, dc in directions:
+            r, c = row + dr, col + dc
+            if grid.in_bounds((r, c)) and not grid.cells[r * grid.cols + c]:
+                neighbor = r * grid.cols + c
+                if dist[neighbor] == np.inf:
+                    dist[neighbor] = dist[current] + 1
+                    queue.append(neighbor)
+                if dist[neighbor] == dist[current] + 1 and (flow[neighbor] < 0 or current < flow[neighbor]):
+                    flow[neighbor] = current
+    return dist, flow
+
+
+def test_wavefront_matches_reference_in_every_direction_order():
+    for seed in range(40):
+        rng = np.random.default_rng(seed)
+        grid = random_grid(rng, 25, density=(0.0, 0.2, 0.4)[seed % 3])
+        goal = int(rng.integers(grid.size))
+        grid.reset(goal)
+        for directions in (DIRECTIONS, DIRECTIONS_ALT, DIRECTIONS[:4], DIRECTIONS_ALT[:4]):
+            dist, flow = wavefront(grid, goal, directions)
+            expected_dist, expected_flow = reference(grid, goal, directions)
+            assert np.array_equal(dist, expected_dist)
+            assert np.array_equal(flow, expected_flow)
+
+
+def test_field_paths_follow_flow_to_the_goal():
+    rng = np.random.default_rng(7)
+    grid = random_grid(rng, 25)
+    goal = 0
+    grid.reset(goal)
+    field = DistanceField(grid, goal)
+    for start in np.flatnonzero(np.isfinite(field.dist)).tolist():
+        path = field.path(start)
+        assert path[0] == start and path[-1] == goal
+        assert len(path) - 1 == field.cost(start)
+    grid.make_obstacle(grid.size // 2)
+    grid.reset(grid.size // 2)
+    assert not field.is_valid()
@@ -0,0 +1,35 @@
+import math
+
+import numpy as np
+
+from camino import HPAStar, distance_field
+from camino.grid import SQRT2
+
+from helpers import path_cost, random_grid
+
+
+def test_paths_after_edits_are_valid_and_match_a_fresh_build():
+    for seed in range(10):
+        rng = np.random.default_rng(seed)
+        grid = random_grid(rng, 40, density=(0.15, 0.3)[seed % 2])
+        planner = HPAStar(size=8)
+        for _ in range(5):
+            free = np.flatnonzero(grid.cells == 0)
+            for _ in range(4):
+                start, end = (int(node) for node in rng.choice(free, 2, replace=False))
+                result = planner(grid, start, end)
+                best = distance_field(grid, end, diagonal=SQRT2)[0][start]
+                if math.isinf(best):
+                    assert not result.found
+                    continue
+                assert result.found and result.cost >= best - 1e-9
+                assert result.path[0] == start and result.path[-1] == end
+                assert math.isclose(path_cost(grid, result.path), result.cost)
+                # Los bloques rehechos tras las ediciones dan lo mismo que
+                # construirlo todo de nuevo
+                assert math.isclose(HPAStar(size=8)(grid, start, end).cost, result.cost)
+            for node in rng.choice(grid.size, 25).tolist():
+                if grid.cells[node]:
+                    grid.reset(node)
+                else:
+                    grid.make_obstacle(node)
@@ -0,0 +1,39 @@
+import math
+
+import numpy as np
+import pytest
+
+from camino import Grid, distance_field, jps
+from camino.grid import DIRECTIONS, DIRECTIONS_ALT, SQRT2
+
+from helpers import path_cost, random_grid
+
+
+def test_costs_match_distance_field():
+    for seed in range(60):
+        rng = np.random.default_rng(seed)
+        grid = random_grid(rng, 30, density=(0.1, 0.25, 0.4)[seed % 3])
+        free = np.flatnonzero(grid.cells == 0)
+        for _ in range(5):
+            start, end = (int(node) for node in rng.choice(free, 2, replace=False))
+            result = jps(grid, start, end)
+            best = distance_field(grid, end, diagonal=SQRT2)[0][start]
+            if math.isinf(best):
+                assert not result.found
+                continue
+            assert result.found and math.isclose(result.cost, best)
+            assert result.path[0] == start and result.path[-1] == end
+            assert math.isclose(path_cost(grid, result.path), best)
+
+
+def test_start_equals_end():
+    grid = Grid(5)
+    result = jps(grid, 12, 12)
+    assert result.path == [12] and result.cost == 0
+
+
+def test_directions_must_be_the_eight_moves():
+    grid = Grid(5)
+    assert math.isclose(jps(grid, 0, 24, None, DIRECTIONS_ALT).cost, 4 * SQRT2)
+    with pytest.raises(ValueError):
+        jps(grid, 0, 24, None, DIRECTIONS[:4])
@@ -0,0 +1,100 @@
+import math
+
+import numpy as np
+
+from camino import Grid, Landmarks, astar, distance_field
+from camino.grid import DIRECTIONS, DIRECTIONS_ALT, SQRT2
+
+from helpers import random_grid
+
+
+def check_bounds(landmarks, rng, goals=5):
+    # Las cotas nunca pasan de la distancia real en el mapa actual
+    grid = landmarks.grid
+    for goal in rng.choice(np.flatnonzero(grid.cells == 0), goals).tolist():
+        dist = distance_field(grid, goal, landmarks.directions, landmarks.diagonal)[0]
+        table = landmarks.table(goal)
+        assert np.all(table <= dist)
+        # La octil exacta puede diferir en el último bit de la suma de pasos
+        h = landmarks.function(goal)
+        assert all(h(node) <= dist[node] + 1e-9 for node in range(grid.size))
+
+
+def check_distances(landmarks):
+    # Las distancias guardadas son las del mapa actual desde cada landmark
+    grid = landmarks.grid
+    landmarks.table(0)  # Incorpora los cambios del mapa
+    for node, dist in zip(landmarks.nodes, landmarks.dist):
+        assert np.allclose(dist, distance_field(grid, node, landmarks.directions, landmarks.diagonal)[0])
+
+
+def test_bounds_stay_admissible_after_edits():
+    for seed in range(8):
+        rng = np.random.default_rng(seed)
+        grid = random_grid(rng, 20)
+        landmarks = Landmarks(grid, count=4, seed=seed)
+        check_bounds(landmarks, rng)
+        for _ in range(6):
+            for node in rng.choice(grid.size, 8).tolist():
+                if rng.random() < 0.5:
+                    grid.make_obstacle(node)
+                else:
+                    grid.reset(node)
+            check_bounds(landmarks, rng)
+        # Cambio masivo, sin historial de celdas
+        grid.cells[:] = (rng.random(grid.size) < 0.3).astype(np.uint8)
+        grid.update_neighbors()
+        check_bounds(landmarks, rng)
+
+
+def test_freed_cells_propagate_shorter_distances():
+    for seed in range(8):
+        rng = np.random.default_rng(seed)
+        grid = random_grid(rng, 20, density=0.4)
+        landmarks = Landmarks(grid, count=3, seed=seed)
+        for node in rng.choice(np.flatnonzero(grid.cells), 25, replace=False).tolist():
+            grid.reset(node)
+        check_distances(landmarks)
+
+
+def test_save_and_load_reconcile_with_the_current_map(tmp_path):
+    for seed in range(4):
+        rng = np.random.default_rng(seed)
+        grid = random_grid(rng, 20, density=0.35)
+        path = tmp_path / f"landmarks{seed}.npz"
+        Landmarks(grid, count=4, seed=seed).save(path)
+
+        # Sólo se liberan celdas: las tablas cargadas quedan exactas
+        for node in rng.choice(np.flatnonzero(grid.cells), 20, replace=False).tolist():
+            grid.reset(node)
+        landmarks = Landmarks.load(path, grid)
+        check_distances(landmarks)
+
+        # Con obstáculos nuevos además, siguen siendo cotas inferiores
+        for node in rng.choice(grid.size, 30).tolist():
+            grid.make_obstacle(node)
+        for node in rng.choice(np.flatnonzero(grid.cells), 10, replace=False).tolist():
+            grid.reset(node)
+        check_bounds(Landmarks.load(path, grid), rng)
+
+
+def test_admissible_and_optimal_with_astar():
+    rng = np.random.default_rng(5)
+    grid = random_grid(rng, 30)
+    landmarks = Landmarks(grid)
+    assert landmarks.admissible(DIRECTIONS, SQRT2)
+    assert landmarks.admissible(DIRECTIONS[:4], SQRT2)
+    assert not landmarks.admissible(DIRECTIONS, 1)
+
+    free = np.flatnonzero(grid.cells == 0)
+    for start, end in rng.choice(free, (20, 2)).tolist():
+        result = astar(grid, start, end, metric=landmarks)
+        best = distance_field(grid, end, diagonal=SQRT2)[0][start]
+        assert result.found == math.isfinite(best)
+        if result.found:
+            assert math.isclose(result.cost, best)
+            assert result.bound == 1
+    assert astar(grid, int(free[0]), int(free[-1]), None, DIRECTIONS_ALT, landmarks, 1).bound is None
+
+    unit = Landmarks(Grid(10), count=2, directions=DIRECTIONS_ALT, diagonal=1)
+    assert unit.admissible(DIRECTIONS_ALT, 1) and not unit.admissible(DIRECTIONS_ALT, SQRT2)
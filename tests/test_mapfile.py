@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from camino import Grid, load_map, save_map
+
+from helpers import random_grid
+
+
+@pytest.mark.parametrize("packed", [False, True])
+@pytest.mark.parametrize("mmap", [False, True])
+def test_round_trip(tmp_path, packed, mmap):
+    grid = random_grid(np.random.default_rng(0), 37, 29)
+    path = tmp_path / "mapa.cmap"
+    save_map(grid, path, packed=packed)
+    loaded = load_map(path, mmap=mmap)
+    assert (loaded.rows, loaded.cols) == (grid.rows, grid.cols)
+    assert np.array_equal(loaded.cells, grid.cells)
+    assert np.array_equal(loaded.mask, grid.mask)
+
+
+@pytest.mark.parametrize("packed", [False, True])
+@pytest.mark.parametrize("mmap", [False, True])
+def test_truncated_or_padded_files_are_rejected(tmp_path, packed, mmap):
+    grid = Grid(64, cells=np.ones(64 * 64, dtype=np.uint8))
+    path = tmp_path / "mapa.cmap"
+    save_map(grid, path, packed=packed)
+    data = path.read_bytes()
+    for broken in (data[:-100], data + b"\0"):
+        path.write_bytes(broken)
+        with pytest.raises(ValueError):
+            load_map(path, mmap=mmap)
@@ -0,0 +1,112 @@
+import math
+
+import numpy as np
+
+from camino import Grid, ara_star, ara_star_iter, astar, distance_field
+from camino.grid import DIRECTIONS, DIRECTIONS_ALT, SQRT2
+from camino.search import chebyshev, heuristic, heuristic_function, heuristic_table, manhattan, octile
+
+from helpers import path_cost, random_grid
+
+
+def test_heuristic_functions_and_tables_match_the_functions():
+    grid = Grid(7, 9)
+    goal = 23
+    goal_pos = grid.pos(goal)
+    functions = {
+        "euclidean": heuristic,
+        "octile": lambda a, b: octile(a, b, 1.5),
+        "chebyshev": chebyshev,
+        "manhattan": manhattan,
+    }
+    for metric, function in functions.items():
+        h = heuristic_function(grid, goal, metric, 1.5)
+        table = heuristic_table(grid, goal, metric, 1.5)
+        assert table.dtype == np.float32
+        for node in range(grid.size):
+            value = function(grid.pos(node), goal_pos)
+            assert h(node) == value
+            assert value - 1e-5 <= table[node] <= value  # float32 redondeado hacia abajo
+
+
+def test_astar_reads_precomputed_estimates():
+    rng = np.random.default_rng(4)
+    grid = Grid(30, cells=(rng.random(900) < 0.25).astype(np.uint8))
+    free = np.flatnonzero(grid.cells == 0)
+    end = int(free[0])
+    estimates = heuristic_table(grid, end, "octile")
+    for start in free[1:20].tolist():
+        computed = astar(grid, start, end, metric="octile")
+        read = astar(grid, start, end, metric="octile", estimates=estimates)
+        assert read.found == computed.found
+        if read.found:
+            assert math.isclose(read.cost, computed.cost)
+
+
+def test_astar_metrics_are_optimal_for_their_cost_model():
+    for seed in range(20):
+        rng = np.random.default_rng(seed)
+        grid = Grid(25, cells=(rng.random(625) < 0.3).astype(np.uint8))
+        free = np.flatnonzero(grid.cells == 0)
+        for _ in range(5):
+            start, end = (int(node) for node in rng.choice(free, 2, replace=False))
+            for metric, directions, diagonal in (("octile", DIRECTIONS, SQRT2),
+                                                 ("chebyshev", DIRECTIONS_ALT, 1),
+                                                 ("manhattan", DIRECTIONS[:4], SQRT2)):
+                result = astar(grid, start, end, None, directions, metric, diagonal)
+                best = distance_field(grid, end, directions, diagonal)[0][start]
+                assert result.found == (not math.isinf(best))
+                if result.found:
+                    assert math.isclose(result.cost, best)
+
+
+def test_bound_is_only_reported_for_admissible_heuristics():
+    grid = Grid(10)
+    assert astar(grid, 0, 99, weight=2).bound == 2
+    assert astar(grid, 0, 99, metric="octile", weight=1.5).bound == 1.5
+    assert astar(grid, 0, 99, weight=0.5).bound == 1
+    assert astar(grid, 0, 99, None, DIRECTIONS_ALT, "chebyshev", 1).bound == 1
+    assert astar(grid, 0, 99, None, DIRECTIONS[:4], "manhattan").bound == 1
+    assert astar(grid, 0, 99, None, DIRECTIONS_ALT, diagonal=1).bound is None
+    assert astar(grid, 0, 99, metric="manhattan").bound is None
+    assert astar(grid, 0, 99, metric="octile", diagonal=3).bound is None
+
+
+def test_anytime_bounds_hold_and_the_last_path_is_optimal():
+    for seed in range(10):
+        rng = np.random.default_rng(seed)
+        grid = random_grid(rng, 40, density=0.25)
+        free = np.flatnonzero(grid.cells == 0)
+        for _ in range(3):
+            start, end = (int(node) for node in rng.choice(free, 2, replace=False))
+            for metric, directions, diagonal in (("octile", DIRECTIONS, SQRT2),
+                                                 ("chebyshev", DIRECTIONS_ALT, 1)):
+                best = distance_field(grid, end, directions, diagonal)[0][start]
+                results = list(ara_star_iter(grid, start, end, None, directions, metric=metric,
+                                             diagonal=diagonal))
+                if math.isinf(best):
+                    assert len(results) == 1 and not results[0].found
+                    continue
+                for result in results:
+                    assert 1 <= result.bound <= 3
+                    assert result.cost <= result.bound * best + 1e-9
+                    assert math.isclose(path_cost(grid, result.path, diagonal), result.cost)
+                costs = [result.cost for result in results]
+                assert costs == sorted(costs, reverse=True)
+                assert results[-1].bound == 1 and math.isclose(results[-1].cost, best)
+
+
+def test_anytime_first_path_completes_within_a_tiny_budget():
+    rng = np.random.default_rng(11)
+    grid = random_grid(rng, 60, density=0.25)
+    free = np.flatnonzero(grid.cells == 0)
+    for start, end in rng.choice(free, (5, 2)).tolist():
+        best = distance_field(grid, end, diagonal=SQRT2)[0][start]
+        if math.isinf(best):
+            continue
+        results = list(ara_star_iter(grid, start, end, budget=0.0))
+        assert len(results) == 1 and results[0].found
+        assert results[0].cost <= results[0].bound * best + 1e-9
+        result = ara_star(grid, start, end, budget=0.0)
+        assert result.found and math.isclose(result.cost, results[0].cost)
+    assert ara_star(Grid(10), 0, 99, metric="manhattan").bound is None